@@ -1,39 +1,1262 @@
+import io
+import os
+import re
+import bz2
+import glob
+import gzip
+import json
+import lzma
+import zlib
+import shutil
+import sqlite3
+import hashlib
+import tempfile
+import contextlib
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from datetime import datetime, date, time
-from scipy.stats import zscore
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler, MinMaxScaler, RobustScaler
-import matplotlib.pyplot as plt
-import seaborn as sns
+from time import perf_counter
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, date
+
+# matplotlib and seaborn are imported inside the plotting methods: they are
+# slow to import and most batch jobs never plot.
+
+
+def _project(df, columns=None, dtypes=None):
+    # Apply column selection and dtypes to a frame whose reader can't do it while parsing
+    if columns is not None:
+        df = df[[col for col in df.columns if col in columns]]
+    if dtypes:
+        df = df.astype({col: dtype for col, dtype in dtypes.items() if col in df.columns})
+    return df
+
+
+_JSONL_BATCH_ROWS = 100_000
+_SQL_BATCH_ROWS = 10_000
+_STREAMABLE_FORMATS = ("csv", "jsonl", "sqlite")
+_SAVE_BLOCK_ROWS = 100_000
+
+_COMPRESSION_SUFFIXES = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz", ".zip": "zip"}
+_COMPRESSION_MAGIC = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+    (b"PK\x03\x04", "zip"),
+)
+# Each call produces a complete stream; concatenated streams are valid files for all three
+_BLOCK_COMPRESSORS = {
+    "gzip": gzip.compress,
+    "bz2": bz2.compress,
+    "xz": lzma.compress,
+}
+
+
+def _detect_compression(path):
+    # Extension first, then magic bytes (e.g. a gzip file saved as plain .csv)
+    suffix = Path(path).suffix
+    if suffix in _COMPRESSION_SUFFIXES:
+        return _COMPRESSION_SUFFIXES[suffix]
+    if _file_format(path) == "excel":
+        return None  # .xlsx is a zip container by design
+    try:
+        with open(path, "rb") as f:
+            head = f.read(6)
+    except OSError:
+        return None
+    for magic, compression in _COMPRESSION_MAGIC:
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def _write_compressed(blocks, path, compression, append=False, workers=None):
+    # Compress encoded blocks across threads and write them in order as independent streams
+    compress = _BLOCK_COMPRESSORS[compression]
+    workers = workers or os.cpu_count() or 1
+    with open(path, "ab" if append else "wb") as f, ThreadPoolExecutor(workers) as pool:
+        in_flight = []
+        for block in blocks:
+            in_flight.append(pool.submit(compress, block))
+            if len(in_flight) >= 2 * workers:
+                f.write(in_flight.pop(0).result())
+        for future in in_flight:
+            f.write(future.result())
+
+
+def _file_format(path):
+    path = str(path)
+    suffix = Path(path).suffix
+    if suffix in _COMPRESSION_SUFFIXES:
+        path = path[: -len(suffix)]
+    if path.endswith((".xlsx", ".xls")):
+        return "excel"
+    elif path.endswith(".csv"):
+        return "csv"
+    elif path.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    elif path.endswith((".db", ".sqlite", ".sqlite3")):
+        return "sqlite"
+    elif path.endswith(".json"):
+        return "json"
+    raise ValueError(
+        "🔴 Unsupported file format. Supported: .csv, .xlsx, .xls, .json, .jsonl, .ndjson, .db, .sqlite"
+    )
+
+
+def _sql_name(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _sql_query(table=None, query=None, columns=None):
+    # Column selection is pushed into the SELECT when reading a whole table
+    if query:
+        return query
+    if table:
+        selected = ", ".join(_sql_name(col) for col in columns) if columns else "*"
+        return f"SELECT {selected} FROM {_sql_name(table)}"
+    return None
+
+
+def _iter_sqlite_batches(path, query, batch_size, columns=None, dtypes=None):
+    if not query:
+        raise ValueError("🔴 Provide 'table' or 'query' to read from SQLite.")
+    conn = sqlite3.connect(f"file:{Path(path).resolve()}?mode=ro", uri=True)
+    try:
+        cursor = conn.execute(query)
+        names = [description[0] for description in cursor.description]
+        yielded = False
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows and yielded:
+                break
+            yielded = True
+            yield _project(pd.DataFrame.from_records(rows, columns=names), columns, dtypes)
+            if not rows:
+                break
+    finally:
+        conn.close()
+
+
+def _sql_type(dtype):
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(dtype):
+        return "REAL"
+    return "TEXT"
+
+
+def _sql_values(series):
+    # Python objects SQLite can bind: NaN/NaT -> None, timestamps -> ISO strings
+    if pd.api.types.is_datetime64_any_dtype(series):
+        values = series.dt.strftime("%Y-%m-%d %H:%M:%S").astype(object)
+    else:
+        values = series.astype(object)
+        first = series.first_valid_index()
+        if first is not None and isinstance(series.loc[first], date):
+            values = values.map(lambda value: value.isoformat() if isinstance(value, date) else value)
+    return values.where(series.notna(), None).tolist()
+
+
+def _save_sqlite(df, path, table, if_exists="append", upsert_on=None, batch_size=_SQL_BATCH_ROWS):
+    if if_exists not in ("append", "replace", "fail"):
+        raise ValueError("🔴 if_exists must be 'append', 'replace' or 'fail'.")
+    if not df.index.equals(pd.RangeIndex(len(df))) or df.index.name is not None:
+        df = df.reset_index()
+    if upsert_on is not None and upsert_on not in df.columns:
+        raise ValueError(f"🔴 Column '{upsert_on}' not found for upsert.")
+
+    names = [_sql_name(col) for col in df.columns]
+    insert = (
+        f"INSERT INTO {_sql_name(table)} ({', '.join(names)}) "
+        f"VALUES ({', '.join('?' * len(names))})"
+    )
+    if upsert_on is not None:
+        updates = ", ".join(f"{name} = excluded.{name}" for name in names)
+        insert += f" ON CONFLICT({_sql_name(upsert_on)}) DO UPDATE SET {updates}"
+
+    conn = sqlite3.connect(path)
+    try:
+        # One transaction for the whole save
+        with conn:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+            ).fetchone()
+            if exists and if_exists == "fail":
+                raise ValueError(f"🔴 Table '{table}' already exists.")
+            if exists and if_exists == "replace":
+                conn.execute(f"DROP TABLE {_sql_name(table)}")
+            definitions = ", ".join(
+                f"{name} {_sql_type(dtype)}" for name, dtype in zip(names, df.dtypes)
+            )
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {_sql_name(table)} ({definitions})")
+            if upsert_on is not None:
+                conn.execute(
+                    f"CREATE UNIQUE INDEX IF NOT EXISTS {_sql_name(f'ux_{table}_{upsert_on}')} "
+                    f"ON {_sql_name(table)} ({_sql_name(upsert_on)})"
+                )
+            # Only one batch is converted to Python objects at a time
+            for start in range(0, len(df), batch_size):
+                batch = df.iloc[start : start + batch_size]
+                rows = zip(*(_sql_values(batch.iloc[:, i]) for i in range(batch.shape[1])))
+                conn.executemany(insert, rows)
+    finally:
+        conn.close()
+
+
+def _read_file(path, columns=None, dtypes=None, query=None):
+    # Parse a single file, pushing column selection and dtypes down to the reader
+    file_format = _file_format(path)
+    compression = _detect_compression(path)
+    if file_format == "excel":
+        if compression:
+            raise ValueError("🔴 Compressed Excel files are not supported.")
+        return pd.read_excel(path, usecols=columns, dtype=dtypes)
+    elif file_format == "csv":
+        return pd.read_csv(path, usecols=columns, dtype=dtypes, compression=compression)
+    elif file_format in ("jsonl", "sqlite"):
+        # Batches keep the raw text (or cursor rows) of only one batch in memory at a time
+        batch_rows = _SQL_BATCH_ROWS if file_format == "sqlite" else _JSONL_BATCH_ROWS
+        batches = list(_iter_file_chunks(path, batch_rows, columns, dtypes, query))
+        return pd.concat(batches, ignore_index=True) if batches else pd.DataFrame()
+    else:
+        return _project(
+            pd.read_json(path, dtype=dtypes, compression=compression), columns, dtypes
+        )
+
+
+def _timed_read(path, columns=None, dtypes=None, query=None):
+    # Runs in a worker process when several files are loaded at once
+    start = perf_counter()
+    df = _read_file(path, columns, dtypes, query)
+    return df, perf_counter() - start
+
+
+def _resolve_paths(filepath):
+    # A list of paths, a glob pattern or a single path -> list of path strings
+    if isinstance(filepath, (list, tuple)):
+        return [str(path) for path in filepath]
+    filepath = str(filepath)
+    if glob.has_magic(filepath):
+        return sorted(glob.glob(filepath))
+    return [filepath]
+
+
+# Dates in partitioned paths: 2025-03-01, 2025_03, 2025/03/01, date=20250301, sales_2025.csv
+# Only unambiguous partition dates: a full YYYY-MM-DD / YYYY_MM_DD / YYYY/MM/DD / YYYYMMDD date,
+# or Hive-style year=/month=/day=/date= segments. A bare 4-digit number (store_2001) is no date.
+_PARTITION_DATE = re.compile(r"(?<!\d)(?P<year>\d{4})(?P<sep>[-_/]?)(?P<month>\d{2})(?P=sep)(?P<day>\d{2})(?!\d)")
+_PARTITION_KEY = re.compile(r"(?:^|/)(year|month|day|date)=([^/]+)", re.IGNORECASE)
+
+
+def _date_span(year, month=None, day=None):
+    # (first, last) timestamps of a year, month or day; None if it isn't a plausible date
+    try:
+        if day:
+            first = pd.Timestamp(int(year), int(month), int(day))
+            last = first + pd.Timedelta(days=1)
+        elif month:
+            first = pd.Timestamp(int(year), int(month), 1)
+            last = first + pd.DateOffset(months=1)
+        else:
+            first = pd.Timestamp(int(year), 1, 1)
+            last = first + pd.DateOffset(years=1)
+    except ValueError:
+        return None
+    if not 1900 <= first.year <= 2200:
+        return None
+    return first, last - pd.Timedelta(1)
+
+
+def _partition_span(path, pattern=None):
+    # (first, last) timestamps a date-partitioned path can hold; None when it names no date or the
+    # dates it names disagree, so in doubt the file is read
+    path = str(path).replace("\\", "/")
+    spans = []
+    if pattern is not None:
+        for match in re.finditer(pattern, path):
+            parts = match.groupdict()
+            spans.append(_date_span(parts["year"], parts.get("month"), parts.get("day")))
+    else:
+        keys = {}
+        for key, value in _PARTITION_KEY.findall(path):
+            key = key.lower()
+            if key == "date":
+                match = _PARTITION_DATE.fullmatch(value)
+                spans.append(_date_span(*match.group("year", "month", "day")) if match else None)
+            elif value.isdigit():
+                keys[key] = value
+        if "year" in keys:
+            month = keys.get("month")
+            spans.append(_date_span(keys["year"], month, month and keys.get("day")))
+        for match in _PARTITION_DATE.finditer(path):
+            spans.append(_date_span(*match.group("year", "month", "day")))
+    if not spans or None in spans:
+        return None
+    first = max(span[0] for span in spans)
+    last = min(span[1] for span in spans)
+    return (first, last) if first <= last else None
+
+
+def _date_bounds(start=None, end=None):
+    # Inclusive bounds; a date without a time as 'end' covers that whole day
+    lower = pd.Timestamp(start) if start is not None else None
+    upper = None
+    if end is not None:
+        upper = pd.Timestamp(end)
+        if upper == upper.normalize():
+            upper += pd.Timedelta(days=1) - pd.Timedelta(1)
+    return lower, upper
+
+
+def _in_date_range(path, start=None, end=None, pattern=None):
+    span = _partition_span(path, pattern)
+    if span is None:
+        return True
+    lower, upper = _date_bounds(start, end)
+    first, last = span
+    return (lower is None or last >= lower) and (upper is None or first <= upper)
+
+
+def _iter_file_chunks(path, chunksize, columns=None, dtypes=None, query=None):
+    file_format = _file_format(path)
+    compression = _detect_compression(path)
+    if file_format == "csv":
+        with pd.read_csv(
+            path, chunksize=chunksize, usecols=columns, dtype=dtypes, compression=compression
+        ) as reader:
+            yield from reader
+    elif file_format == "jsonl":
+        with pd.read_json(
+            path, lines=True, chunksize=chunksize, compression=compression
+        ) as reader:
+            for batch in reader:
+                yield _project(batch, columns, dtypes)
+    elif file_format == "sqlite":
+        yield from _iter_sqlite_batches(path, query, chunksize, columns, dtypes)
+    else:
+        raise ValueError(
+            "🔴 Streaming mode supports only .csv, .jsonl, .ndjson and SQLite files."
+        )
+
+
+def _reservoir_update(state, chunk, k, rng):
+    # Vectorised Algorithm R: row number i enters slot j = randint(0, i) when j < k
+    seen = state["seen"]
+    positions = np.arange(seen, seen + len(chunk))
+    slots = np.where(positions < k, positions, rng.integers(0, positions + 1))
+    entering = slots < k
+    if entering.any():
+        state["parts"].append(chunk[entering])
+        state["slots"].append(slots[entering])
+        state["pending"] += int(entering.sum())
+    state["seen"] = seen + len(chunk)
+    if state["pending"] > 4 * k:
+        _reservoir_compact(state)
+
+
+def _reservoir_compact(state):
+    # Later writers win a slot, exactly as in the sequential algorithm
+    if not state["parts"]:
+        return
+    frame = pd.concat(state["parts"])
+    slots = np.concatenate(state["slots"])
+    latest = ~pd.Series(slots).duplicated(keep="last").to_numpy()
+    state["parts"], state["slots"] = [frame[latest]], [slots[latest]]
+    state["pending"] = int(latest.sum())
+
+
+def _reservoir_result(state):
+    _reservoir_compact(state)
+    if not state["parts"]:
+        return None
+    order = np.argsort(state["slots"][0])
+    return state["parts"][0].iloc[order]
+
+
+def _new_reservoir():
+    return {"seen": 0, "parts": [], "slots": [], "pending": 0}
+
+
+def _read_byte_sample(path, byte_budget, rng, columns=None, dtypes=None, blocks=32):
+    # Read `blocks` random byte ranges (one per equal segment of the file) and parse the whole lines in them
+    file_format = _file_format(path)
+    if file_format not in ("csv", "jsonl") or _detect_compression(path):
+        raise ValueError(
+            "🔴 byte_budget sampling requires uncompressed .csv or JSON Lines files."
+        )
+
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        header = f.readline() if file_format == "csv" else b""
+        body_start = f.tell()
+        body_size = size - body_start
+        if body_size <= byte_budget:
+            pieces = [f.read()]
+        else:
+            block = max(byte_budget // blocks, 1)
+            segment = body_size // blocks
+            pieces = []
+            for i in range(blocks):
+                start = body_start + i * segment + int(rng.integers(0, max(segment - block, 1)))
+                f.seek(start)
+                data = f.read(block)
+                # Drop the partial first and last lines of the block
+                first = data.find(b"\n") + 1 if start > body_start else 0
+                last = data.rfind(b"\n") + 1
+                if last > first:
+                    pieces.append(data[first:last])
+
+    body = b"".join(pieces)
+    if file_format == "csv":
+        df = pd.read_csv(io.BytesIO(header + body), usecols=columns, dtype=dtypes)
+    else:
+        df = _project(pd.read_json(io.BytesIO(body), lines=True), columns, dtypes)
+    estimated_rows = round(len(df) * body_size / len(body)) if body else 0
+    return df, estimated_rows
+
+
+def _guess_date_format(values, sample=20):
+    # Most common format guessed over a few distinct values; one odd value doesn't decide it
+    from pandas.tseries.api import guess_datetime_format
+
+    guesses = [guess_datetime_format(str(value)) for value in values[:sample]]
+    guesses = [guess for guess in guesses if guess is not None]
+    if not guesses:
+        return None
+    # Ties go to the format seen first, so the choice is the same on every run
+    return Counter(guesses).most_common(1)[0][0]
+
+
+def _parse_dates_cached(series, date_format=None, strict=True):
+    # Parse each distinct value once, strings with one fixed format. strict: None unless every
+    # non-null value matches it; otherwise like pd.to_datetime(errors="coerce"), with values that
+    # don't match falling back to per-value inference
+    codes, uniques = pd.factorize(series)
+    uniques = pd.Index(uniques, dtype=object)
+    if pd.api.types.infer_dtype(uniques, skipna=True) == "string":
+        date_format = date_format or _guess_date_format(uniques)
+    else:
+        date_format = None
+    if date_format is None:
+        if strict:
+            return None, None
+        parsed = pd.to_datetime(uniques, errors="coerce")
+    else:
+        parsed = pd.to_datetime(uniques, format=date_format, errors="coerce")
+        failed = parsed.isna()
+        if failed.any():
+            if strict:
+                return None, date_format
+            parsed = parsed.to_numpy(copy=True)
+            parsed[failed] = pd.to_datetime(uniques[failed], errors="coerce").to_numpy()
+    values = pd.DatetimeIndex(parsed).take(codes, allow_fill=True, fill_value=pd.NaT)
+    return pd.Series(values, index=series.index, name=series.name), date_format
+
+
+def _downcast(series, float_tolerance=1e-6, category_ratio=0.5, parse_dates=True):
+    # Narrowest dtype that keeps the values (floats within float_tolerance, relative)
+    dtype = series.dtype
+    if pd.api.types.is_bool_dtype(dtype) or not isinstance(dtype, np.dtype):
+        return series
+    if pd.api.types.is_integer_dtype(dtype):
+        if series.empty:
+            return series
+        kind = "unsigned" if series.min() >= 0 else "integer"
+        return pd.to_numeric(series, downcast=kind)
+    if pd.api.types.is_float_dtype(dtype) and dtype != np.float32:
+        values = series.to_numpy()
+        narrowed = values.astype(np.float32)
+        with np.errstate(over="ignore", invalid="ignore"):
+            if np.allclose(narrowed, values, rtol=float_tolerance, atol=0, equal_nan=True):
+                return pd.Series(narrowed, index=series.index, name=series.name)
+        return series
+    if dtype == object and pd.api.types.infer_dtype(series, skipna=True) == "string":
+        if parse_dates:
+            parsed, _ = _parse_dates_cached(series)
+            if parsed is not None:
+                return parsed
+        if series.nunique(dropna=True) <= category_ratio * max(len(series), 1):
+            return series.astype("category")
+    return series
+
+
+def _leading_zeros64(x):
+    # Vectorised count of leading zero bits of uint64 values
+    x = x.copy()
+    zeros = np.zeros(len(x), dtype=np.uint8)
+    for shift in (32, 16, 8, 4, 2, 1):
+        top_clear = x < (np.uint64(1) << np.uint64(64 - shift))
+        zeros[top_clear] += shift
+        x[top_clear] <<= np.uint64(shift)
+    return zeros + (x >> np.uint64(63) == 0)
+
+
+def _hll_distinct(series, precision=14):
+    # HyperLogLog estimate of the number of distinct non-null values (~0.8% error at p=14)
+    hashes = pd.util.hash_pandas_object(series.dropna(), index=False).to_numpy()
+    if len(hashes) == 0:
+        return 0
+    m = 1 << precision
+    buckets = (hashes >> np.uint64(64 - precision)).astype(np.int64)
+    ranks = np.minimum(_leading_zeros64(hashes << np.uint64(precision)) + 1, 64 - precision + 1)
+    registers = np.zeros(m, dtype=np.uint8)
+    np.maximum.at(registers, buckets, ranks.astype(np.uint8))
+    estimate = 0.7213 / (1 + 1.079 / m) * m * m / np.sum(np.ldexp(1.0, -registers.astype(int)))
+    empty = int((registers == 0).sum())
+    if estimate <= 2.5 * m and empty:
+        estimate = m * np.log(m / empty)
+    return int(round(estimate))
+
+
+def _profile_column(series, approx_distinct=False, top_k=5, sample_rows=100_000):
+    # All per-column statistics from one factorize (hash) pass plus NumPy reductions
+    n = len(series)
+    if approx_distinct:
+        nulls = int(series.isna().sum())
+        distinct = _hll_distinct(series)
+        step = max(n // sample_rows, 1)
+        codes, uniques = pd.factorize(series.iloc[::step])
+    else:
+        codes, uniques = pd.factorize(series)
+        nulls = int((codes < 0).sum())
+        distinct = len(uniques)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    top = np.argsort(-counts, kind="stable")[:top_k]
+    stats = {
+        "dtype": str(series.dtype),
+        "count": n - nulls,
+        "nulls": nulls,
+        "distinct": distinct,
+        "min": np.nan,
+        "max": np.nan,
+        "mean": np.nan,
+        "var": np.nan,
+        "top_values": [(uniques[i], int(counts[i])) for i in top],
+    }
+    if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+        values = _as_array(series)
+        if n - nulls:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                stats["min"] = np.nanmin(values)
+                stats["max"] = np.nanmax(values)
+                stats["mean"] = np.nanmean(values, dtype=np.float64)
+                stats["var"] = np.nanvar(values, dtype=np.float64, ddof=1) if n - nulls > 1 else np.nan
+    return stats
+
+
+def _combine_results(previous, result):
+    # Merge the return value of a check run on one chunk into the running total
+    if isinstance(result, pd.DataFrame):
+        result = len(result)
+    if previous is None:
+        return result
+    if isinstance(result, pd.Series):
+        return previous.add(result, fill_value=0)
+    if isinstance(result, (int, float, np.integer, np.floating)):
+        return previous + result
+    return result
+
+
+_BLOCK_ROWS = 1_000_000
+# Steps whose result depends on statistics of the whole column, not just of the rows at hand
+_QUARTILE_SAMPLE_ROWS = 1_000_000  # IQR quartiles in chunked mode are exact up to this many values
+_GLOBAL_STAT_STEPS = ("check_outliers", "remove_outliers_zscore", "remove_outliers_iqr", "remove_outliers_from_column")
+_TIME_STRATEGIES = ("time", "nearest", "ffill", "bfill", "seasonal")
+_IMPUTE_STRATEGIES = ("mean", "median", "most_frequent", "mode", "constant", "drop", *_TIME_STRATEGIES)
+
+
+def _imputation_methods(df, strategy, categorical_strategy=None):
+    # Fill method per column: strategy for the columns it applies to, categorical_strategy for text
+    numerical_cols = df.select_dtypes(include="number").columns
+    categorical_cols = df.select_dtypes(include=["object", "category"]).columns
+    methods = {}
+    if strategy in ("mode", "constant", "nearest", "ffill", "bfill", "seasonal"):
+        methods.update(dict.fromkeys(df.columns, strategy))
+    elif strategy in ("mean", "median", "time"):
+        methods.update(dict.fromkeys(numerical_cols, strategy))
+    if strategy == "most_frequent" or categorical_strategy:
+        method = categorical_strategy or "mode"
+        methods.update(dict.fromkeys(categorical_cols, "mode" if method == "most_frequent" else method))
+    return methods
+
+
+def _group_list(df, group_by):
+    group_by = [group_by] if isinstance(group_by, str) else list(group_by)
+    missing = [col for col in group_by if col not in df.columns]
+    if missing:
+        raise ValueError(f"🔴 Group column(s) not found in the DataFrame: {missing}")
+    return group_by
+
+
+def _group_modes(codes, series):
+    # Most frequent value per group (smallest on ties, like Series.mode), broadcast back to the rows;
+    # one count over (group, value) pairs instead of a mode() call per group
+    pairs = pd.DataFrame({"group": codes, "value": series.to_numpy()}).dropna()
+    counts = pairs.value_counts(sort=False).sort_index().sort_values(ascending=False, kind="stable")
+    groups = counts.index.get_level_values(0)
+    first = ~groups.duplicated()
+    modes = pd.Series(counts.index.get_level_values(1)[first], index=groups[first])
+    return modes.reindex(codes).to_numpy()
+
+
+def _neighbour_fills(values, valid, times, group_start, group_last, strategy, max_gap=None):
+    # Rows sorted by (group, time): fill each row from the previous/next valid row of its group
+    n = len(values)
+    positions = np.arange(n)
+    prev = np.maximum.accumulate(np.where(valid, positions, -1))
+    nxt = np.minimum.accumulate(np.where(valid, positions, n)[::-1])[::-1]
+    has_prev = prev >= group_start
+    has_next = nxt <= group_last
+    prev = np.where(has_prev, prev, 0)
+    nxt = np.where(has_next, nxt, 0)
+    since_prev = times - times[prev]
+    until_next = times[nxt] - times
+
+    if strategy == "ffill":
+        take, source = has_prev, prev
+        gap = since_prev
+    elif strategy == "bfill":
+        take, source = has_next, nxt
+        gap = until_next
+    else:
+        # Interpolation only between two known values, never past the ends of a group
+        take = has_prev & has_next
+        use_prev = since_prev <= until_next
+        source = np.where(use_prev, prev, nxt)
+        gap = since_prev + until_next if strategy == "time" else np.minimum(since_prev, until_next)
+    if max_gap is not None:
+        take &= gap <= max_gap
+
+    filled = np.full(n, np.nan, dtype=np.float64 if values.dtype.kind == "f" else object)
+    if strategy == "time":
+        span = (since_prev + until_next).astype(np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weight = np.where(span > 0, since_prev / span, 0.0)
+        linear = values[prev] + weight * (values[nxt] - values[prev])
+        filled[take] = linear[take]
+    else:
+        filled[take] = values[source[take]]
+    return filled
+
+
+def _row_fingerprints(df):
+    # 64-bit hash per row, combined from vectorised per-column hashes; the index is not part of it.
+    # duplicated() treats -0.0 as 0.0 and every NaN as equal, so floats are normalised first
+    floats = [i for i, dtype in enumerate(df.dtypes) if pd.api.types.is_float_dtype(dtype)]
+    if floats:
+        columns = {i: df.iloc[:, i] for i in range(df.shape[1])}
+        for i in floats:
+            columns[i] = columns[i].where(columns[i].notna()) + 0.0
+        df = pd.DataFrame(columns, copy=False)
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+# (fingerprint, second independent hash, row number); two 64-bit hashes make collisions negligible
+_DEDUPE_RECORD = np.dtype([("fingerprint", "<u8"), ("check", "<u8"), ("row", "<i8")])
+_DEDUPE_CHECK_KEY = "dsml.second.key."  # hash_pandas_object wants a 16-character key
+
+
+def _value_hashes(series, hash_key=None):
+    # Per-value hashes that don't depend on how a chunk parsed the column: integral numbers hash as
+    # int64 (exact, so large IDs never go through float64) and other numbers as float64, whether
+    # the column is int or float; -0.0 and every NaN hash like 0.0 and NaN
+    key = {"hash_key": hash_key} if hash_key else {}
+    dtype = series.dtype
+    if not pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+        return pd.util.hash_pandas_object(series, index=False, **key).to_numpy()
+    missing = series.isna().to_numpy()
+    if pd.api.types.is_integer_dtype(dtype):
+        integral = ~missing
+        ints = series.to_numpy(dtype=np.int64, na_value=0)
+        floats = np.full(len(series), np.nan)
+    else:
+        floats = series.to_numpy(dtype=np.float64, na_value=np.nan) + 0.0
+        floats[missing] = np.nan
+        with np.errstate(invalid="ignore"):
+            integral = (floats == np.floor(floats)) & (np.abs(floats) < 2.0**63)
+        ints = np.where(integral, floats, 0).astype(np.int64)
+    return np.where(integral, pd.util.hash_array(ints, **key), pd.util.hash_array(floats, **key))
+
+
+def _stream_fingerprints(frame):
+    # Chunks of one file may parse the same column as int in one chunk and float in another, so
+    # rows are hashed from dtype-independent value hashes, with two independent keys
+    fingerprints = []
+    for hash_key in (None, _DEDUPE_CHECK_KEY):
+        hashes = pd.DataFrame(
+            {i: _value_hashes(frame.iloc[:, i], hash_key) for i in range(frame.shape[1])}
+        )
+        key = {"hash_key": hash_key} if hash_key else {}
+        fingerprints.append(pd.util.hash_pandas_object(hashes, index=False, **key).to_numpy())
+    return tuple(fingerprints)
+
+
+def _dedupe_partition(path, keep):
+    # Row numbers flagged as duplicates within one hash partition (rows arrive in file order)
+    records = np.fromfile(path, dtype=_DEDUPE_RECORD)
+    keys = pd.DataFrame({"fingerprint": records["fingerprint"], "check": records["check"]})
+    return records["row"][keys.duplicated(keep=keep).to_numpy()]
+
+
+_MINHASH_PRIME = 4294967311  # smallest prime above 2**32
+
+
+def _shingles(text, size=2):
+    # Character q-grams of the padded, lower-cased text
+    text = f" {text.strip().lower()} "
+    return {text[i : i + size] for i in range(max(len(text) - size + 1, 1))}
+
+
+def _minhash_signatures(values, num_perm=64, shingle_size=2, seed=0):
+    # One MinHash signature per distinct string; a final all-max row stands for missing values
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 2**31, num_perm, dtype=np.uint64)
+    b = rng.integers(0, _MINHASH_PRIME, num_perm, dtype=np.uint64)
+    signatures = np.full((len(values) + 1, num_perm), _MINHASH_PRIME, dtype=np.uint64)
+    for i, value in enumerate(values):
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode()) for shingle in _shingles(str(value), shingle_size)),
+            dtype=np.uint64,
+        )
+        signatures[i] = ((hashes[:, None] * a + b) % np.uint64(_MINHASH_PRIME)).min(axis=0)
+    return signatures
+
+
+_NEAR_BUCKET_WIDTH = 16  # numeric bucket width in tolerances: a pair within tolerance shares a bucket with p >= 15/16
+
+
+def _bucket_pairs(key, window, tiebreak=None):
+    # Pairs of rows sharing a key: every pair in buckets of up to window + 1 rows, and in larger
+    # buckets each row with its next `window` rows in tiebreak order
+    # Singleton buckets can't pair; a hash pass drops them so only the rest is sorted
+    order = np.flatnonzero(pd.Series(key).duplicated(keep=False).to_numpy())
+    if tiebreak is not None:
+        order = order[np.lexsort((tiebreak[order], key[order]))]
+    else:
+        order = order[np.argsort(key[order], kind="stable")]
+    sorted_key = key[order]
+    left, right = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)]
+    for k in range(1, window + 1):
+        same = sorted_key[k:] == sorted_key[:-k]
+        if not same.any():
+            break  # no bucket has more than k rows
+        left.append(order[:-k][same])
+        right.append(order[k:][same])
+    return np.concatenate(left), np.concatenate(right)
+
+
+def _connected_components(n, left, right):
+    # Union-find over edge arrays: min-label propagation with pointer jumping, all vectorised
+    labels = np.arange(n)
+    while True:
+        low = np.minimum(labels[left], labels[right])
+        new = labels.copy()
+        np.minimum.at(new, left, low)
+        np.minimum.at(new, right, low)
+        new = new[new]
+        if np.array_equal(new, labels):
+            return labels
+        labels = new
+
+
+def _spanning_forest(left, right):
+    # The same clusters with one edge per clustered row: each row linked to its cluster's first row
+    nodes, edges = np.unique(np.concatenate([left, right]), return_inverse=True)
+    labels = _connected_components(len(nodes), edges[: len(left)], edges[len(left) :])
+    linked = labels != np.arange(len(nodes))
+    return nodes[linked], nodes[labels[linked]]
+
+
+def _json_scalar(value):
+    # Fill values as plain JSON: NumPy scalars -> Python, timestamps -> ISO strings
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (pd.Timestamp, datetime, date)):
+        return value.isoformat()
+    return value
+
+
+_COLUMNS_FORMAT = 2  # version of the _write_columns() layout; 1 pickled object columns
+
+
+def _save_distinct(path, values):
+    # Distinct values without pickle: a fixed-width unicode array when they are all strings,
+    # otherwise a JSON list of [type, value] pairs for the scalar types pandas produces
+    values = list(values)
+    if all(isinstance(value, str) for value in values):
+        np.save(path.with_suffix(".npy"), np.array(values, dtype=str))
+        return "str"
+    tagged = []
+    for value in values:
+        if isinstance(value, (bool, np.bool_)):
+            tagged.append(["bool", bool(value)])
+        elif isinstance(value, (int, np.integer)):
+            tagged.append(["int", int(value)])
+        elif isinstance(value, (float, np.floating)):
+            tagged.append(["float", float(value)])
+        elif isinstance(value, str):
+            tagged.append(["str", value])
+        elif isinstance(value, (pd.Timestamp, datetime)):
+            tagged.append(["datetime", value.isoformat()])
+        elif isinstance(value, date):
+            tagged.append(["date", value.isoformat()])
+        else:
+            raise TypeError(f"🔴 Values of type {type(value).__name__} can't be stored without pickle.")
+    path.with_suffix(".json").write_text(json.dumps(tagged))
+    return "json"
+
+
+def _load_distinct(path, encoding):
+    if encoding == "str":
+        return np.load(path.with_suffix(".npy")).astype(object)
+    parse = {
+        "bool": bool,
+        "int": int,
+        "float": float,
+        "str": str,
+        "datetime": pd.Timestamp,
+        "date": date.fromisoformat,
+    }
+    values = [parse[kind](value) for kind, value in json.loads(path.with_suffix(".json").read_text())]
+    result = np.empty(len(values), dtype=object)
+    result[:] = values
+    return result
+
+
+def _write_columns(df, directory):
+    # Store each column as its own .npy file so it can be memory-mapped later
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    index_names = None
+    if not df.index.equals(pd.RangeIndex(len(df))) or df.index.name is not None:
+        index_names = list(df.index.names)
+        df = df.reset_index()
+    layout = []
+    for i, col in enumerate(df.columns):
+        series = df.iloc[:, i]
+        info = {"name": col, "dtype": str(series.dtype)}
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biufcmM":
+            np.save(directory / f"col_{i}.npy", series.to_numpy())
+            info["kind"] = "array"
+        else:
+            # Categoricals and object/extension columns are stored as codes plus their distinct values
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                codes, distinct = series.cat.codes.to_numpy(), series.cat.categories
+                info["kind"] = "category"
+            else:
+                codes, distinct = pd.factorize(series)
+                info["kind"] = "object"
+            np.save(directory / f"col_{i}.npy", codes)
+            info["values"] = _save_distinct(directory / f"col_{i}_values", distinct)
+        layout.append(info)
+
+    meta = {"format": _COLUMNS_FORMAT, "rows": len(df), "columns": layout, "index": index_names}
+    (directory / "meta.json").write_text(json.dumps(meta))
+    return meta
+
+
+def _read_columns(directory, mmap_mode="c"):
+    # Rebuild a frame from _write_columns() output; numeric columns stay memory-mapped
+    directory = Path(directory)
+    meta = json.loads((directory / "meta.json").read_text())
+    if meta.get("format") != _COLUMNS_FORMAT:
+        raise ValueError(f"🔴 '{directory}' was written in an older layout. Write it again.")
+    arrays = []
+    for i, info in enumerate(meta["columns"]):
+        if info["kind"] == "array":
+            arrays.append(np.load(directory / f"col_{i}.npy", mmap_mode=mmap_mode))
+            continue
+        codes = np.load(directory / f"col_{i}.npy")
+        distinct = _load_distinct(directory / f"col_{i}_values", info["values"])
+        if info["kind"] == "category":
+            arrays.append(pd.Categorical.from_codes(codes, categories=pd.Index(distinct).infer_objects()))
+        else:
+            # Code -1 (missing) picks the NaN appended at the end
+            values = np.append(distinct, np.nan)[codes]
+            arrays.append(pd.array(values, dtype=info["dtype"]) if info["dtype"] != "object" else values)
+
+    names = [info["name"] for info in meta["columns"]]
+    index = pd.RangeIndex(meta["rows"])
+    levels = len(meta.get("index") or [])
+    if levels:
+        # Build the index up front; set_index() would copy the memory-mapped columns
+        index = pd.MultiIndex.from_arrays(arrays[:levels], names=meta["index"])
+        if levels == 1:
+            index = index.get_level_values(0)
+        arrays, names = arrays[levels:], names[levels:]
+
+    df = pd.DataFrame(dict(enumerate(arrays)), index=index, copy=False)
+    df.columns = names
+    return df
+
+
+def _numeric_positions(df):
+    # Positions of the columns select_dtypes(include="number") would pick, without building a new frame
+    return [
+        i
+        for i, dtype in enumerate(df.dtypes)
+        if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+    ]
+
+
+def _as_array(series):
+    # Zero-copy view for NumPy-backed (including memory-mapped) columns
+    if isinstance(series.dtype, np.dtype):
+        return series.to_numpy()
+    return series.to_numpy(dtype="float64", na_value=np.nan)
+
+
+def _is_integer_like(series):
+    # One comparison over the whole array instead of float.is_integer per element
+    if pd.api.types.is_integer_dtype(series.dtype):
+        return True
+    if not pd.api.types.is_float_dtype(series.dtype):
+        return False
+    values = _as_array(series)
+    values = values[~np.isnan(values)]
+    return bool(np.isfinite(values).all() and (values == np.floor(values)).all())
+
+
+def _nullable_int(series):
+    # Whole-number floats -> Int64 by building the masked array directly (astype("Int64") re-checks every value)
+    if isinstance(series.dtype, pd.Int64Dtype):
+        return series
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    mask = np.isnan(values)
+    array = pd.arrays.IntegerArray(np.where(mask, 0, values).astype(np.int64), mask)
+    return pd.Series(array, index=series.index, name=series.name)
+
+
+def _block_mean_std(values, block_rows=_BLOCK_ROWS):
+    # Population mean/std (as in scipy.stats.zscore) in fixed-size blocks, so the column is never copied whole
+    n = len(values)
+    if n == 0:
+        return np.nan, np.nan
+    total = 0.0
+    for start in range(0, n, block_rows):
+        total += values[start : start + block_rows].sum(dtype=np.float64)
+    mean = total / n
+    squares = 0.0
+    for start in range(0, n, block_rows):
+        block = values[start : start + block_rows].astype(np.float64, copy=False)
+        squares += np.square(block - mean).sum()
+    return mean, np.sqrt(squares / n)
+
+
+def _merge_moments(moments, values):
+    # Chan et al. pairwise update of (count, mean, M2); NaN propagates like in _block_mean_std
+    n = len(values)
+    if n == 0:
+        return moments
+    mean = values.mean(dtype=np.float64)
+    m2 = np.square(values.astype(np.float64, copy=False) - mean).sum()
+    if moments is None:
+        return n, mean, m2
+    count, total_mean, total_m2 = moments
+    delta = mean - total_mean
+    combined = count + n
+    return (
+        combined,
+        total_mean + delta * n / combined,
+        total_m2 + m2 + delta**2 * count * n / combined,
+    )
+
+
+def _zscores(values, mean, std):
+    # A zero std (constant column or group, one-row group) gives z = 0 instead of NaN/inf;
+    # missing values keep a NaN z-score
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (values.astype(np.float64, copy=False) - mean) / np.where(std == 0, np.inf, std)
+
+
+def _rows(stat, start, stop):
+    # Column statistics are scalars, or one value per row when computed per group
+    return stat[start:stop] if np.ndim(stat) else stat
+
+
+def _zscore_masks(arrays, stats, z_thresh, n_rows, block_rows=_BLOCK_ROWS):
+    # Outlier counts per column, rows with any |z| > z_thresh and rows with every |z| < z_thresh
+    counts = np.zeros(len(arrays), dtype=np.int64)
+    any_outlier = np.zeros(n_rows, dtype=bool)
+    all_inside = np.ones(n_rows, dtype=bool)
+    for j, values in enumerate(arrays):
+        mean, std = stats[j]
+        for start in range(0, n_rows, block_rows):
+            stop = start + block_rows
+            z = np.abs(_zscores(values[start:stop], _rows(mean, start, stop), _rows(std, start, stop)))
+            outside = z > z_thresh
+            counts[j] += outside.sum()
+            any_outlier[start:stop] |= outside
+            all_inside[start:stop] &= z < z_thresh
+    return counts, any_outlier, all_inside
+
+
+class FileCache:
+    def __init__(self, cache_dir, max_bytes=2 * 1024**3):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def content_hash(path, full=False, block_size=1024**2):
+        # By default only the first and last block are hashed; full=True hashes the whole file
+        digest = hashlib.blake2b(digest_size=16)
+        size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            if full or size <= 2 * block_size:
+                for block in iter(lambda: f.read(block_size), b""):
+                    digest.update(block)
+            else:
+                digest.update(f.read(block_size))
+                f.seek(-block_size, os.SEEK_END)
+                digest.update(f.read(block_size))
+        return digest.hexdigest()
+
+    def key(self, path, options=None, full_hash=False):
+        stat = os.stat(path)
+        parts = [
+            str(Path(path).resolve()),
+            str(stat.st_size),
+            str(stat.st_mtime_ns),
+            self.content_hash(path, full=full_hash),
+            json.dumps(options or {}, sort_keys=True, default=str),
+        ]
+        return hashlib.blake2b("|".join(parts).encode(), digest_size=16).hexdigest()
+
+    def get(self, key):
+        entry = self.cache_dir / key
+        if not (entry / "meta.json").exists():
+            return None
+        # Entries in an older layout are treated as misses and rewritten
+        if json.loads((entry / "meta.json").read_text()).get("format") != _COLUMNS_FORMAT:
+            return None
+        # Touch the entry so eviction treats it as recently used
+        os.utime(entry / "meta.json")
+        return _read_columns(entry)
+
+    def put(self, key, df, source=None):
+        entry = self.cache_dir / key
+        tmp_entry = self.cache_dir / f".{key}.tmp"
+        shutil.rmtree(tmp_entry, ignore_errors=True)
+        try:
+            _write_columns(df, tmp_entry)
+        except TypeError as error:
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+            print(f"🔺 Not cached: {error}")
+            return None
+        (tmp_entry / "source.txt").write_text(str(Path(source).resolve()) if source else "")
+        shutil.rmtree(entry, ignore_errors=True)
+        os.replace(tmp_entry, entry)
+        self.evict()
+        return entry
+
+    def entries(self):
+        return [
+            entry
+            for entry in self.cache_dir.iterdir()
+            if entry.is_dir() and (entry / "meta.json").exists()
+        ]
+
+    def size(self):
+        return sum(f.stat().st_size for f in self.cache_dir.rglob("*") if f.is_file())
+
+    def evict(self):
+        # Drop least recently used entries until the cache fits in max_bytes
+        entries = sorted(self.entries(), key=lambda e: (e / "meta.json").stat().st_mtime)
+        sizes = {e: sum(f.stat().st_size for f in e.iterdir()) for e in entries}
+        total = sum(sizes.values())
+        evicted = 0
+        while entries and total > self.max_bytes:
+            oldest = entries.pop(0)
+            shutil.rmtree(oldest, ignore_errors=True)
+            total -= sizes[oldest]
+            evicted += 1
+        return evicted
+
+    def invalidate(self, source=None):
+        # Remove every entry, or only those built from the given source file
+        removed = 0
+        source = str(Path(source).resolve()) if source else None
+        for entry in self.entries():
+            if source is None or (entry / "source.txt").read_text() == source:
+                shutil.rmtree(entry, ignore_errors=True)
+                removed += 1
+        return removed
 
 
 class DataProcessor:
-    def __init__(self, filepath=None, dataset=None):
+    @property
+    def df(self):
+        return self._df
+
+    @df.setter
+    def df(self, value):
+        self._df = value
+        self._touch()
+
+    def _touch(self):
+        # Every change to the data bumps the version; cached statistics are keyed on it
+        self._version = getattr(self, "_version", 0) + 1
+
+    def __init__(
+        self,
+        filepath=None,
+        dataset=None,
+        chunksize=None,
+        columns=None,
+        dtypes=None,
+        cache_dir=None,
+        cache_max_bytes=2 * 1024**3,
+        source_column=None,
+        max_workers=None,
+        table=None,
+        query=None,
+    ):
         self.df = None
         self.filepath = filepath
+        self.filepaths = _resolve_paths(filepath) if filepath else []
+        self.chunksize = chunksize
+        self.columns = list(columns) if columns is not None else None
+        self.dtypes = dict(dtypes) if dtypes else None
+        self.table = table
+        self.query = _sql_query(table, query, self.columns)
+        self.cache = FileCache(cache_dir, cache_max_bytes) if cache_dir else None
+        self.source_column = source_column
+        self.max_workers = max_workers
+        self.load_timings = {}
+        self.chunk_summary = {}
+        self.sample_info = None
+        self.increment_state = None
+        self.increment_summary = {}
+        self.memory_report = None
+        self.dedupe_summary = {}
+        self.date_range = None
+        self.date_pattern = None
+        self._profiles = {}
+        self._stats = {}
+        self._stat_hits = 0
+        self._stat_misses = 0
 
         if dataset is not None:
             self.df = pd.DataFrame(dataset)
             self.filepath = None
+            self.filepaths = []
         elif not filepath:
             raise ValueError("🔴 Either 'filepath' or 'dataset' must be provided.")
 
-    def load(self):
+    def load(
+        self,
+        use_cache=True,
+        full_hash=False,
+        sample_size=None,
+        sample_method="reservoir",
+        stratify_by=None,
+        byte_budget=None,
+        random_state=None,
+        date_range=None,
+        date_pattern=None,
+    ):
+        self.date_range = tuple(date_range) if date_range is not None else None
+        if date_pattern is not None and "year" not in re.compile(date_pattern).groupindex:
+            raise ValueError("🔴 date_pattern needs a named group 'year' (optionally 'month' and 'day').")
+        self.date_pattern = date_pattern
+        paths = self._source_paths()
+        if date_range is not None and len(paths) < len(self.filepaths):
+            print(
+                f"🔸 Skipped {len(self.filepaths) - len(paths)} of {len(self.filepaths)} "
+                f"file(s) outside {date_range[0] or 'the first date'} → {date_range[1] or 'the last date'}."
+            )
+        if sample_size or byte_budget:
+            try:
+                return self._load_sample(
+                    sample_size, sample_method, stratify_by, byte_budget, random_state
+                )
+            except Exception as e:
+                raise RuntimeError(
+                    f"🔺Your file wasn't properly loaded !! Reason: {str(e)}"
+                )
+
+        self.sample_info = None
+        if self.chunksize:
+            if not all(_file_format(path) in _STREAMABLE_FORMATS for path in paths):
+                raise ValueError(
+                    "🔴 Streaming mode supports only .csv, .jsonl, .ndjson and SQLite files."
+                )
+            missing = [path for path in paths if not Path(path).exists()]
+            if not paths or missing:
+                raise RuntimeError(
+                    f"🔺Your file wasn't properly loaded !! Reason: File not found: {missing or self.filepath}"
+                )
+            print(
+                f"🟢 Streaming mode enabled — {len(paths)} file(s) will be read in chunks of {self.chunksize} rows."
+            )
+            return self
+
         try:
-            if self.filepath.endswith((".xlsx", ".xls")):
-                self.df = pd.read_excel(self.filepath)
-            elif self.filepath.endswith(".csv"):
-                self.df = pd.read_csv(self.filepath)
-            elif self.filepath.endswith(".json"):
-                self.df = pd.read_json(self.filepath)
+            if not paths:
+                if self.filepaths:
+                    raise ValueError(f"No files in '{self.filepath}' fall inside {self.date_range}.")
+                raise ValueError(f"No files match '{self.filepath}'.")
+
+            self.load_timings = {}
+            frames = [None] * len(paths)
+            cache_keys = {}
+            pending = []
+            options = {"columns": self.columns, "dtypes": self.dtypes, "query": self.query}
+
+            # 1. Serve what we can from the cache
+            for i, path in enumerate(paths):
+                if self.cache is not None and use_cache:
+                    start = perf_counter()
+                    cache_keys[i] = self.cache.key(path, options, full_hash=full_hash)
+                    frames[i] = self.cache.get(cache_keys[i])
+                    if frames[i] is not None:
+                        self.load_timings[path] = perf_counter() - start
+                        continue
+                pending.append(i)
+
+            # 2. Parse the rest, concurrently when there is more than one file
+            if len(pending) > 1 and self.max_workers != 1:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                    futures = {
+                        i: pool.submit(
+                            _timed_read, paths[i], self.columns, self.dtypes, self.query
+                        )
+                        for i in pending
+                    }
+                    for i, future in futures.items():
+                        frames[i], self.load_timings[paths[i]] = future.result()
             else:
-                raise ValueError(
-                    "🔴 Unsupported file format. Supported: .csv, .xlsx, .xls, .json"
+                for i in pending:
+                    frames[i], self.load_timings[paths[i]] = _timed_read(
+                        paths[i], self.columns, self.dtypes, self.query
+                    )
+
+            if self.cache is not None and use_cache:
+                for i in pending:
+                    self.cache.put(cache_keys[i], frames[i], source=paths[i])
+
+            # 3. One concatenation for all files
+            self.df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+            if self.source_column:
+                codes, sources = pd.factorize(pd.Index(paths))
+                self.df[self.source_column] = pd.Categorical.from_codes(
+                    np.repeat(codes, [len(frame) for frame in frames]), categories=sources
                 )
+                self._touch()
 
-            print("🟢 Data loaded successfully.")
+            if len(paths) == 1:
+                cached = " (from cache)" if not pending else ""
+                print(f"🟢 Data loaded successfully{cached}.")
+            else:
+                print(
+                    f"🟢 Data loaded successfully from {len(paths)} files "
+                    f"({len(paths) - len(pending)} from cache)."
+                )
+                for path in paths:
+                    print(f"🔸 {path}: {self.load_timings[path]:.3f}s")
             return self
 
         except Exception as e:
@@ -41,6 +1264,620 @@ class DataProcessor:
                 f"🔺Your file wasn't properly loaded !! Reason: {str(e)}"
             )
 
+    def _source_paths(self):
+        # Source files, minus date partitions outside the range given to load()
+        if self.date_range is None:
+            return self.filepaths
+        return [
+            path
+            for path in self.filepaths
+            if _in_date_range(path, *self.date_range, pattern=self.date_pattern)
+        ]
+
+    def _iter_source_frames(self):
+        # Stream CSV/JSON Lines sources in chunks; other formats arrive as one frame
+        chunksize = self.chunksize or _JSONL_BATCH_ROWS
+        for path in self._source_paths():
+            if _file_format(path) in _STREAMABLE_FORMATS:
+                frames = _iter_file_chunks(
+                    path, chunksize, self.columns, self.dtypes, self.query
+                )
+            else:
+                frames = [_read_file(path, self.columns, self.dtypes, self.query)]
+            for frame in frames:
+                if self.source_column:
+                    frame[self.source_column] = path
+                yield frame
+
+    def _load_sample(self, sample_size, method, stratify_by, byte_budget, random_state):
+        if method not in ("reservoir", "stratified"):
+            raise ValueError("🔴 Invalid sample_method. Choose from: 'reservoir' or 'stratified'.")
+        if method == "stratified" and (not stratify_by or not sample_size):
+            raise ValueError("🔴 Stratified sampling needs 'stratify_by' and 'sample_size'.")
+        paths = self._source_paths()
+        if not paths:
+            raise ValueError(f"No files match '{self.filepath}'.")
+
+        start = perf_counter()
+        rng = np.random.default_rng(random_state)
+
+        # 1. Source rows: a full stream, or random byte ranges when a byte budget is given
+        if byte_budget:
+            sizes = np.array([os.path.getsize(path) for path in paths], dtype=float)
+            frames, population = [], 0
+            for path, size in zip(paths, sizes):
+                budget = max(int(byte_budget * size / sizes.sum()), 1)
+                frame, estimated_rows = _read_byte_sample(
+                    path, budget, rng, self.columns, self.dtypes
+                )
+                if self.source_column:
+                    frame[self.source_column] = path
+                frames.append(frame)
+                population += estimated_rows
+            frames = [pd.concat(frames, ignore_index=True)]
+            population_exact = False
+        else:
+            frames = self._iter_source_frames()
+            population = None
+            population_exact = True
+
+        # 2. Reservoir (per stratum when stratified) over the source rows
+        strata = {}
+        if method == "stratified":
+            for frame in frames:
+                for key, group in frame.groupby(stratify_by, sort=False, observed=True):
+                    state = strata.setdefault(key, _new_reservoir())
+                    _reservoir_update(state, group, sample_size, rng)
+            counts = {key: state["seen"] for key, state in strata.items()}
+            total = sum(counts.values())
+            parts = []
+            for key, state in strata.items():
+                # Proportional allocation; a uniform subset of a uniform reservoir is still uniform
+                reservoir = _reservoir_result(state)
+                share = max(round(sample_size * counts[key] / total), 1)
+                picks = rng.choice(len(reservoir), size=min(share, len(reservoir)), replace=False)
+                parts.append(reservoir.iloc[np.sort(picks)])
+            sample = pd.concat(parts) if parts else pd.DataFrame()
+            seen = total
+        elif sample_size:
+            state = _new_reservoir()
+            for frame in frames:
+                _reservoir_update(state, frame, sample_size, rng)
+            sample = _reservoir_result(state)
+            seen = state["seen"]
+        else:
+            sample = frames[0]
+            seen = len(sample)
+
+        if sample is None:
+            sample = pd.DataFrame()
+        self.df = sample.reset_index(drop=True)
+        if population is None:
+            population = seen
+        else:
+            # Rows read inside the byte ranges are the frame we sampled from
+            population = max(population, seen)
+
+        # 3. Precision of estimated proportions (worst case p = 0.5) at 95% confidence
+        n = len(self.df)
+        fpc = np.sqrt((population - n) / (population - 1)) if population > 1 else 0.0
+        margin = 1.96 * np.sqrt(0.25 / n) * fpc if n else np.nan
+        self.sample_info = {
+            "method": (method if sample_size else "all rows") + (" over byte ranges" if byte_budget else ""),
+            "sample_size": n,
+            "population_rows": population,
+            "population_exact": population_exact,
+            "confidence": 0.95,
+            "margin_of_error": margin,
+            "strata": {key: state["seen"] for key, state in strata.items()} or None,
+            "seconds": perf_counter() - start,
+        }
+        print(f"🟢 Sample loaded successfully in {self.sample_info['seconds']:.2f}s.")
+        self.sample_report()
+        return self
+
+    def sample_report(self):
+        if not self.sample_info:
+            print("🔹 Data is not a sample — estimates are exact.")
+            return None
+        info = self.sample_info
+        approx = "" if info["population_exact"] else "~"
+        print(
+            f"🔸 Sample of {info['sample_size']} row(s) out of {approx}{info['population_rows']} "
+            f"({info['method']})."
+        )
+        print(
+            f"🔸 Proportions estimated from it (e.g. share of missing values, duplicates, outliers) "
+            f"are within ±{info['margin_of_error']:.2%} at {info['confidence']:.0%} confidence."
+        )
+        if info["strata"]:
+            print(f"🔸 Rows per stratum in the source: {info['strata']}")
+        return info
+
+    def use_memmap(self, directory, mmap_mode="c"):
+        _write_columns(self.df, directory)
+        self.df = _read_columns(directory, mmap_mode=mmap_mode)
+        mapped = [
+            col
+            for col in self.df.columns
+            if isinstance(self.df[col].dtype, np.dtype)
+            and isinstance(self.df[col].to_numpy().base, np.memmap)
+        ]
+        print(f"🟢 Memory-mapped {len(mapped)} numeric column(s) from '{directory}': {mapped}")
+        return self
+
+    @classmethod
+    def from_memmap(cls, directory, mmap_mode="r"):
+        processor = cls(dataset=_read_columns(directory, mmap_mode=mmap_mode))
+        print(f"🟢 Data attached from memory-mapped directory '{directory}'.")
+        return processor
+
+    def _column_stat(self, column, name, compute):
+        # Memoised on (column, statistic) until the data version changes
+        if self._stats.get("version") != self._version:
+            self._stats = {"version": self._version}
+        key = (column, name)
+        if key in self._stats:
+            self._stat_hits += 1
+        else:
+            self._stat_misses += 1
+            self._stats[key] = compute()
+        return self._stats[key]
+
+    def stats_cache_info(self):
+        entries = sum(1 for key in self._stats if key != "version")
+        return {
+            "hits": self._stat_hits,
+            "misses": self._stat_misses,
+            "entries": entries,
+            "version": self._version,
+        }
+
+    def invalidate_stats(self):
+        # For in-place edits of df, which the version counter can't see
+        self._touch()
+        print("🟢 Cached statistics invalidated.")
+        return self
+
+    def _seed_stats(self, stats):
+        # Replace the cache with precomputed statistics (e.g. of the whole file in chunked mode)
+        self._stats = {"version": self._version, **stats}
+
+    def _mean_std(self, position):
+        # Duplicate column names can't key the cache, so those columns are recomputed
+        values = _as_array(self.df.iloc[:, position])
+        if not self.df.columns.is_unique:
+            return _block_mean_std(values)
+        return self._column_stat(
+            self.df.columns[position], "mean_std", lambda: _block_mean_std(values)
+        )
+
+    def _content_digest(self, position):
+        # One vectorised hash pass over the column, folded into a single digest
+        def compute():
+            hashes = pd.util.hash_pandas_object(self.df.iloc[:, position], index=False)
+            return hashlib.blake2b(hashes.to_numpy().tobytes(), digest_size=16).digest()
+
+        if not self.df.columns.is_unique:
+            return compute()
+        return self._column_stat(self.df.columns[position], "content_digest", compute)
+
+    def _content_duplicate_positions(self, keep="first"):
+        # Columns grouped by digest, each confirmed with an exact compare against its group's kept column
+        positions = range(self.df.shape[1])
+        if keep == "last":
+            positions = reversed(positions)
+        kept = {}
+        redundant = {}
+        for position in positions:
+            column = self.df.iloc[:, position]
+            candidates = kept.setdefault(self._content_digest(position), [])
+            match = next((p for p in candidates if self.df.iloc[:, p].equals(column)), None)
+            if match is None:
+                candidates.append(position)
+            else:
+                redundant[position] = match
+        return dict(sorted(redundant.items()))
+
+    def _grouped(self, frame, group_by):
+        # Group by columns of self.df (also when grouping a column subset of it)
+        return frame.groupby(
+            [self.df[col] for col in group_by], sort=False, observed=True, dropna=False
+        )
+
+    def _group_mean_std(self, positions, group_by):
+        # Per-row mean and population std of each row's group, one transform pass per statistic
+        grouped = self._grouped(self.df.iloc[:, positions], group_by)
+        means = grouped.transform("mean")
+        stds = grouped.transform("std", ddof=0)
+        return [
+            (
+                means.iloc[:, j].to_numpy(dtype=np.float64, na_value=np.nan),
+                stds.iloc[:, j].to_numpy(dtype=np.float64, na_value=np.nan),
+            )
+            for j in range(len(positions))
+        ]
+
+    def _zscore_outliers(self, z_thresh, group_by=None):
+        def compute():
+            positions = _numeric_positions(self.df)
+            if group_by:
+                positions = [i for i in positions if self.df.columns[i] not in group_by]
+            arrays = [_as_array(self.df.iloc[:, i]) for i in positions]
+            if group_by:
+                stats = self._group_mean_std(positions, group_by)
+            else:
+                stats = [self._mean_std(i) for i in positions]
+            counts, any_outlier, all_inside = _zscore_masks(
+                arrays, stats, z_thresh, len(self.df)
+            )
+            return positions, arrays, stats, counts, any_outlier, all_inside
+
+        key = ("zscore", z_thresh, tuple(group_by or ()))
+        return self._column_stat(None, key, compute)
+
+    def invalidate_cache(self, all_files=False):
+        if self.cache is None:
+            print("🔺 No cache configured (set 'cache_dir').")
+            return self
+        if all_files:
+            removed = self.cache.invalidate()
+        else:
+            removed = sum(self.cache.invalidate(path) for path in self.filepaths)
+        print(f"🟢 Removed {removed} cache entr{'y' if removed == 1 else 'ies'}.")
+        return self
+
+    def iter_chunks(self):
+        if not self.chunksize:
+            raise ValueError("🔴 Set 'chunksize' to iterate over the file in chunks.")
+
+        for path in self._source_paths():
+            for chunk in _iter_file_chunks(
+                path, self.chunksize, self.columns, self.dtypes, self.query
+            ):
+                if self.source_column:
+                    chunk[self.source_column] = path
+                yield DataProcessor(dataset=chunk)
+
+    def _chunk_stats(self, steps, seeds, name, kwargs):
+        # One pass over the file: run the steps before an outlier step on each chunk and
+        # accumulate the statistics that step needs over the whole file
+        kept = [k for k, step in enumerate(steps) if not step[0].startswith(("check_", "inspect_", "log_"))]
+        seeds = {i: seeds[k] for i, k in enumerate(kept) if k in seeds}
+        steps = [steps[k] for k in kept]
+        moments, samples = {}, {}
+        column = kwargs.get("column")
+        rng = np.random.default_rng(0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            for chunk in self.iter_chunks():
+                chunk._run_steps(steps, {}, seeds)
+                df = chunk.df
+                if name == "remove_outliers_iqr":
+                    # Quartiles come from a uniform reservoir sample, so memory stays bounded
+                    if column in df.columns:
+                        col_values = pd.Series(_as_array(df[column]).astype(np.float64)).dropna()
+                        state = samples.setdefault(column, _new_reservoir())
+                        _reservoir_update(state, col_values, _QUARTILE_SAMPLE_ROWS, rng)
+                    continue
+                if name == "remove_outliers_from_column":
+                    columns = [column] if column in df.columns else []
+                else:
+                    columns = df.columns[_numeric_positions(df)]
+                for col in columns:
+                    col_values = _as_array(df[col])
+                    if name == "remove_outliers_from_column":
+                        col_values = _as_array(df[col].dropna())
+                    moments[col] = _merge_moments(moments.get(col), col_values)
+
+        stat = "mean_std_dropna" if name == "remove_outliers_from_column" else "mean_std"
+        stats = {
+            (col, stat): (mean, np.sqrt(m2 / count)) for col, (count, mean, m2) in moments.items()
+        }
+        for col, state in samples.items():
+            sample = _reservoir_result(state)
+            stats[(col, "quartiles")] = (
+                np.quantile(sample.to_numpy(), [0.25, 0.75]) if sample is not None and len(sample)
+                else np.full(2, np.nan)
+            )
+        return stats
+
+    def process_chunks(self, steps, path=None, format="csv", verbose=False, **save_kwargs):
+        if not self.chunksize:
+            raise ValueError("🔴 Set 'chunksize' to process the file in chunks.")
+        steps = [(step, {}) if isinstance(step, str) else step for step in steps]
+        for name, kwargs in steps:
+            if name in _GLOBAL_STAT_STEPS and kwargs.get("group_by") is not None:
+                raise ValueError(f"🔴 '{name}' with group_by is not supported in chunked mode.")
+
+        # Outlier steps use statistics of the whole file, gathered in one extra pass per step,
+        # so the result does not depend on chunksize
+        seeds = {}
+        for k, (name, kwargs) in enumerate(steps):
+            if name in _GLOBAL_STAT_STEPS:
+                seeds[k] = self._chunk_stats(steps[:k], seeds, name, kwargs)
+
+        self.chunk_summary = {}
+        num_chunks = rows_in = rows_out = 0
+
+        for chunk in self.iter_chunks():
+            rows_in += len(chunk.df)
+            # Per-chunk messages are silenced unless verbose=True
+            output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+            with output:
+                chunk._run_steps(steps, self.chunk_summary, seeds)
+                if path is not None:
+                    chunk.save(path, format=format, append=num_chunks > 0, **save_kwargs)
+            rows_out += len(chunk.df)
+            num_chunks += 1
+
+        print(
+            f"🟢 Processed {num_chunks} chunk(s): {rows_in} rows in, {rows_out} rows out."
+        )
+        for name, summary in self.chunk_summary.items():
+            print(f"🔹 {name}:")
+            print(summary)
+        if path is not None:
+            print(f"🟢 Data saved to {path}")
+        return self
+
+    def dedupe_external(
+        self,
+        path,
+        method="keep_first",
+        subset=None,
+        format="csv",
+        partitions=64,
+        temp_dir=None,
+        verbose=False,
+        **save_kwargs,
+    ):
+        if method not in ("keep_first", "keep_last", "drop_all", "flag"):
+            raise ValueError(f"🔴 Unknown duplicate handling method: '{method}'")
+        if not self.filepaths:
+            raise ValueError("🔴 External deduplication needs a file source ('filepath').")
+        # Same masks as handle_duplicates: keep_last drops earlier copies, the others later ones
+        keep = "last" if method == "keep_last" else "first"
+        columns = [subset] if isinstance(subset, str) else subset
+
+        with tempfile.TemporaryDirectory(dir=temp_dir) as workdir:
+            # 1. Stream the source once, hash-partitioning (fingerprint, row number) to temp files
+            part_paths = [Path(workdir) / f"part_{i:04d}.bin" for i in range(partitions)]
+            rows = 0
+            with contextlib.ExitStack() as stack:
+                files = [stack.enter_context(open(part, "ab")) for part in part_paths]
+                for frame in self._iter_source_frames():
+                    fingerprint, check = _stream_fingerprints(frame[columns] if columns else frame)
+                    records = np.empty(len(frame), dtype=_DEDUPE_RECORD)
+                    records["fingerprint"], records["check"] = fingerprint, check
+                    records["row"] = np.arange(rows, rows + len(frame))
+                    rows += len(frame)
+
+                    part = fingerprint % partitions
+                    order = np.argsort(part, kind="stable")
+                    bounds = np.searchsorted(part[order], np.arange(partitions + 1))
+                    for i in np.flatnonzero(np.diff(bounds)):
+                        records[order[bounds[i] : bounds[i + 1]]].tofile(files[i])
+
+            # 2. Deduplicate each partition independently, in parallel
+            if self.max_workers == 1:
+                flagged = [_dedupe_partition(part, keep) for part in part_paths]
+            else:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                    flagged = list(pool.map(_dedupe_partition, part_paths, [keep] * partitions))
+        duplicates = np.sort(np.concatenate(flagged)) if flagged else np.empty(0, dtype=np.int64)
+
+        # 3. Second pass over the source: write the surviving (or flagged) rows in file order
+        start = written = num_chunks = 0
+        output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+        with output:
+            for frame in self._iter_source_frames():
+                first, stop = np.searchsorted(duplicates, [start, start + len(frame)])
+                is_dup = np.zeros(len(frame), dtype=bool)
+                is_dup[duplicates[first:stop] - start] = True
+                start += len(frame)
+                if method == "flag":
+                    frame["is_duplicate"] = is_dup
+                else:
+                    frame = frame[~is_dup]
+                DataProcessor(dataset=frame).save(path, format=format, append=num_chunks > 0, **save_kwargs)
+                written += len(frame)
+                num_chunks += 1
+
+        self.dedupe_summary = {
+            "rows": rows,
+            "duplicates": len(duplicates),
+            "rows_written": written,
+            "partitions": partitions,
+        }
+        print(
+            f"🟢 External deduplication ('{method}'): {rows} rows in, {len(duplicates)} duplicate(s), "
+            f"{written} rows written to {path}"
+        )
+        return self
+
+    def _run_steps(self, steps, summary, seeds=None):
+        # Apply (method_name, kwargs) steps and fold check results into summary;
+        # seeds maps a step index to statistics the step must use instead of its own
+        for k, step in enumerate(steps):
+            name, kwargs = (step, {}) if isinstance(step, str) else step
+            if seeds and k in seeds:
+                self._seed_stats(seeds[k])
+            result = getattr(self, name)(**kwargs)
+            if result is not None and result is not self:
+                summary[name] = _combine_results(summary.get(name), result)
+        return summary
+
+    def load_increment(
+        self,
+        steps=None,
+        id_column="ID",
+        subset=None,
+        state_path=None,
+        verbose=False,
+        duplicate_filter=None,
+    ):
+        if len(self.filepaths) != 1 or _file_format(self.filepaths[0]) != "csv":
+            raise ValueError("🔴 Incremental loading supports a single .csv file.")
+        path = self.filepaths[0]
+        if _detect_compression(path):
+            raise ValueError("🔴 Incremental loading does not support compressed files.")
+
+        # 1. Restore the state of the previous run; with state_path the kept rows are stored
+        # next to it, one part per run, so a restarted process still sees the earlier rows
+        rows_dir = Path(f"{state_path}.rows") if state_path else None
+        state = self.increment_state
+        if state is None and state_path and Path(state_path).exists():
+            state = json.loads(Path(state_path).read_text())
+            if self.df is None:
+                parts = [
+                    _read_columns(rows_dir / f"part_{i:06d}", mmap_mode=None)
+                    for i in range(state.get("parts", 0))
+                ]
+                self.df = pd.concat(parts) if parts else None
+            if self.df is not None and duplicate_filter is not None and not len(duplicate_filter.fingerprints):
+                with contextlib.redirect_stdout(io.StringIO()):
+                    duplicate_filter.add(self)
+        size = os.path.getsize(path)
+        if state is None:
+            state = {"offset": 0, "last_id": None, "header": None, "rows": 0, "parts": 0}
+            self.df = None
+            if rows_dir is not None:
+                shutil.rmtree(rows_dir, ignore_errors=True)
+        elif size < state["offset"]:
+            # Rotated or re-exported: read it again, keeping the earlier rows (step 3 skips repeats)
+            print("🔺 File is smaller than at the last run — reading it from the start.")
+            state = {**state, "offset": 0, "header": None}
+        rereading = state["offset"] == 0 and state["last_id"] is not None
+
+        # 2. Read only the complete lines appended since the last offset
+        with open(path, "rb") as f:
+            f.seek(state["offset"])
+            if state["offset"] == 0:
+                state["header"] = f.readline().decode()
+                state["offset"] = f.tell()
+            data = f.read()
+        complete = data[: data.rfind(b"\n") + 1]
+        new = pd.read_csv(
+            io.BytesIO(state["header"].encode() + complete),
+            usecols=self.columns,
+            dtype=self.dtypes,
+        )
+        new.index = pd.RangeIndex(state["rows"], state["rows"] + len(new))
+        state["offset"] += len(complete)
+        state["rows"] += len(new)
+
+        # 3. Bytes past the offset are new whatever their ID (IDs of several tills interleave);
+        # only a file read again from the start is filtered on the IDs already processed
+        parsed = skipped = len(new)
+        if id_column in new.columns and len(new):
+            if rereading:
+                new = new[new[id_column] > state["last_id"]]
+            if len(new):
+                last_id = _json_scalar(new[id_column].max())
+                state["last_id"] = last_id if state["last_id"] is None else max(last_id, state["last_id"])
+        skipped -= len(new)
+
+        # 4. Clean the new rows only
+        batch = DataProcessor(dataset=new)
+        summary = {}
+        if steps:
+            output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+            with output:
+                batch._run_steps(steps, summary)
+
+        # 5. Drop new rows that duplicate rows kept from earlier runs, then merge
+        cross_duplicates = 0
+        if duplicate_filter is not None:
+            # Screen against the keys of every earlier run instead of rehashing the kept rows
+            before = len(batch.df)
+            with contextlib.redirect_stdout(io.StringIO()):
+                duplicate_filter.drop_seen(batch)
+            cross_duplicates = before - len(batch.df)
+            kept = batch.df
+        elif self.df is None:
+            kept = batch.df
+        else:
+            combined = pd.concat([self.df, batch.df])
+            is_dup = combined.duplicated(subset=subset, keep="first").to_numpy()[len(self.df):]
+            cross_duplicates = int(is_dup.sum())
+            kept = batch.df[~is_dup]
+        self.df = kept if self.df is None else pd.concat([self.df, kept])
+
+        self.increment_state = state
+        self.increment_summary = summary
+        if state_path:
+            # The rows are written before the state, so a crash in between only repeats this run
+            if len(kept):
+                part = rows_dir / f"part_{state.get('parts', 0):06d}"
+                shutil.rmtree(part, ignore_errors=True)
+                _write_columns(kept, part)
+                state["parts"] = state.get("parts", 0) + 1
+            Path(state_path).write_text(json.dumps(state))
+
+        print(
+            f"🟢 Incremental load: {parsed} new row(s) parsed, {skipped} already processed row(s) "
+            f"skipped, {cross_duplicates} duplicate(s) of earlier rows dropped, {len(self.df)} row(s) in total."
+        )
+        for name, result in summary.items():
+            print(f"🔹 {name}:")
+            print(result)
+        return self
+
+    def optimize_dtypes(
+        self, float_tolerance=1e-6, category_ratio=0.5, parse_dates=True, exclude=None
+    ):
+        exclude = set(exclude or [])
+        before = self.df.memory_usage(deep=True, index=False)
+        dtypes_before = self.df.dtypes
+
+        for i, col in enumerate(self.df.columns):
+            if col in exclude:
+                continue
+            series = self.df.iloc[:, i]
+            narrowed = _downcast(series, float_tolerance, category_ratio, parse_dates)
+            if narrowed is not series:
+                self.df.isetitem(i, narrowed)
+        self._touch()
+
+        after = self.df.memory_usage(deep=True, index=False)
+        self.memory_report = pd.DataFrame(
+            {
+                "dtype_before": dtypes_before.astype(str).to_numpy(),
+                "dtype_after": self.df.dtypes.astype(str).to_numpy(),
+                "bytes_before": before.to_numpy(),
+                "bytes_after": after.to_numpy(),
+            },
+            index=self.df.columns,
+        )
+        self.memory_report["saved_pct"] = (
+            100 * (1 - self.memory_report["bytes_after"] / self.memory_report["bytes_before"])
+        ).round(1)
+
+        print("🔹 Memory usage per column (before → after):")
+        print(self.memory_report)
+        print(
+            f"🟢 Memory reduced from {before.sum() / 1024**2:.2f} MB "
+            f"to {after.sum() / 1024**2:.2f} MB."
+        )
+        return self
+
+    def profile(self, approx_distinct=False, top_k=5, refresh=False):
+        # One scan per column; reused by the checks until the data changes
+        key = (approx_distinct, top_k)
+        if refresh or self._profiles.get("version") != self._version:
+            self._profiles = {"version": self._version}
+        if key not in self._profiles:
+            rows = [
+                _profile_column(self.df.iloc[:, i], approx_distinct, top_k)
+                for i in range(self.df.shape[1])
+            ]
+            self._profiles[key] = pd.DataFrame(
+                rows,
+                index=self.df.columns,
+                columns=["dtype", "count", "nulls", "distinct", "min", "max", "mean", "var", "top_values"],
+            )
+        return self._profiles[key]
+
     def check_dtypes(self):
         print("Data types:")
         print(self.df.dtypes)
@@ -52,8 +1889,9 @@ class DataProcessor:
             print("🔴 No categorical columns found.")
         else:
             print(f"🟢 Categorical columns and unique value counts:")
-            for col in categorical_cols:
-                unique_count = self.df[col].nunique(dropna=True)
+            distinct = self.profile()["distinct"]
+            is_categorical = self.df.columns.isin(categorical_cols)
+            for col, unique_count in zip(self.df.columns[is_categorical], distinct[is_categorical]):
                 print(f" - {col}: {unique_count} unique value(s)")
         return list(categorical_cols)
 
@@ -71,6 +1909,7 @@ class DataProcessor:
             print("🔺 No matching columns found to drop.")
         else:
             self.df.drop(columns=to_drop, inplace=True)
+            self._touch()
             print(f"🟢 Dropped columns: {to_drop}")
         if not_found:
             print(
@@ -87,6 +1926,7 @@ class DataProcessor:
             return self
 
         self.df.set_index(column_name, inplace=True)
+        self._touch()
         print(f"🟢 Column '{column_name}' set as index.")
         return self
 
@@ -97,6 +1937,8 @@ class DataProcessor:
         log_path="invalid_datetime_rows.csv",
         check_index=True,
         force_plain_date=False,
+        date_format=None,
+        as_date_objects=False,
     ):
 
         # 0. If already index, skip re-indexing
@@ -110,12 +1952,16 @@ class DataProcessor:
         if index_column not in self.df.columns:
             raise ValueError(f"🔴 Column '{index_column}' not found in the DataFrame.")
 
-        # 2. Convert to datetime if not already
+        # 2. Convert to datetime if not already (format inferred once, each distinct value parsed once)
         if not pd.api.types.is_datetime64_any_dtype(self.df[index_column]):
-            self.df[index_column] = pd.to_datetime(
-                self.df[index_column], errors="coerce"
+            self.df[index_column], date_format = _parse_dates_cached(
+                self.df[index_column], date_format, strict=False
             )
-            print(f"🟢 Column '{index_column}' converted to datetime.")
+            self._touch()
+            if date_format:
+                print(f"🟢 Column '{index_column}' converted to datetime (format '{date_format}').")
+            else:
+                print(f"🟢 Column '{index_column}' converted to datetime.")
 
         # 3. Check for all NaT values
         if self.df[index_column].isna().all():
@@ -134,28 +1980,28 @@ class DataProcessor:
                 print(f"🔸 Invalid datetime rows saved to: {log_path}")
 
         # 5. Format date vs datetime
-        non_na_values = self.df[index_column].dropna()
-        sample_value = non_na_values.iloc[0]
+        # Plain dates stay datetime64 at midnight, so filtering and resampling on the index stay
+        # vectorised; as_date_objects=True gives the older object column of datetime.date values.
+        column = self.df[index_column]
+        date_only = (column.dt.normalize() == column) | column.isna()
 
-        if isinstance(sample_value, date) and not isinstance(sample_value, datetime):
-            print(f"🟢 Column '{index_column}' is already in date format (YYYY-MM-DD).")
+        if force_plain_date:
+            print(
+                f"🟢 force_plain_date=True — converting '{index_column}' to plain date."
+            )
+        elif date_only.all():
+            print(
+                f"🟢 Column '{index_column}' appears to be date-only — converting to plain date."
+            )
         else:
-            if force_plain_date:
-                print(
-                    f"🟢 force_plain_date=True — converting '{index_column}' to plain date."
-                )
-                self.df[index_column] = self.df[index_column].dt.date
-            else:
-                if hasattr(sample_value, "time") and sample_value.time() == time(0, 0):
-                    print(
-                        f"🟢 Column '{index_column}' appears to be date-only — converting to plain date."
-                    )
-                    self.df[index_column] = self.df[index_column].dt.date
-                else:
-                    print(
-                        f"🟢 Column '{index_column}' contains time — normalizing to 00:00:00."
-                    )
-                    self.df[index_column] = self.df[index_column].dt.normalize()
+            print(
+                f"🟢 Column '{index_column}' contains time — normalizing to 00:00:00."
+            )
+        column = column.dt.normalize()
+        if as_date_objects and (force_plain_date or date_only.all()):
+            column = column.dt.date
+        self.df[index_column] = column
+        self._touch()
 
         # 6. Warn about duplicate index values
         if self.df[index_column].duplicated().any():
@@ -169,6 +2015,7 @@ class DataProcessor:
             return self
 
         self.df.set_index(index_column, inplace=True)
+        self._touch()
         print(f"🟢 Index set to column: '{index_column}'")
 
         # 8. Check if index is datetime or date
@@ -199,8 +2046,33 @@ class DataProcessor:
             )
             return False
 
+    def filter_by_date_range(self, start=None, end=None):
+        if not isinstance(self.df.index, pd.DatetimeIndex):
+            raise TypeError(
+                "🔴 filter_by_date_range needs a DatetimeIndex — call set_index_date() first."
+            )
+
+        # Sort once (stable, so rows on the same date keep their order); later calls find it sorted
+        if not self.df.index.is_monotonic_increasing:
+            self.df = self.df.sort_index(kind="stable")
+            print("🔸 Index sorted by date.")
+
+        # Two binary searches on the sorted index give the slice; no per-row comparison
+        lower, upper = _date_bounds(start, end)
+        index = self.df.index
+        first = 0 if lower is None else index.searchsorted(lower, side="left")
+        stop = len(index) if upper is None else index.searchsorted(upper, side="right")
+
+        before_rows = len(self.df)
+        self.df = self.df.iloc[first:stop]
+        print(
+            f"🟢 Kept {len(self.df)} of {before_rows} row(s) between "
+            f"{start or 'the first date'} and {end or 'the last date'}."
+        )
+        return self
+
     def check_missing(self, verbose=True, return_all=False, return_rows=False):
-        missing_counts = self.df.isnull().sum()
+        missing_counts = self.profile()["nulls"].astype("int64").rename(None)
         total_missing = missing_counts.sum()
         
         if verbose:
@@ -217,84 +2089,268 @@ class DataProcessor:
             print(f"🔸 Missing value row indices:: {row_indices}")
             return missing_rows
 
-    def handle_missing_values(self, strategy="mean", force_int_cols=None):
+        return missing_counts
+
+    def handle_missing_values(
+        self,
+        strategy="mean",
+        force_int_cols=None,
+        categorical_strategy=None,
+        fill_value=None,
+        group_by=None,
+        max_gap=None,
+        season="7D",
+    ):
         if force_int_cols is None:
             force_int_cols = []
-			
-        initial_missing = self.df.isnull().sum().sum()
+
+        missing_counts = self._null_counts()
+        initial_missing = missing_counts.sum()
 
         if initial_missing == 0:
             print("🟢 No missing values to handle.")
             return self
-    
-	    # Helper function to check if a column is integer-like
-        def is_integer_like(series):
-            return pd.api.types.is_numeric_dtype(series) and series.dropna().apply(float.is_integer).all()    
-        
-		    # Identify columns with missing values
-            missing_cols = self.df.columns[self.df.isnull().any()]
-            numerical_cols = self.df[missing_cols].select_dtypes(include=["int64", "float64"]).columns
-            categorical_cols = self.df[missing_cols].select_dtypes(include=["object", "category"]).columns
-
-            if strategy == "mean":
-                filled_cols = []
-                for col in numerical_cols:
-                    if self.df[col].isnull().any():
-                        mean_value = self.df[col].mean()
-                        if col in force_int_cols or is_integer_like(self.df[col]):
-                            mean_value = round(mean_value)
-                            self.df[col] = self.df[col].fillna(mean_value).astype(int)
-                        else:
-                            self.df[col] = self.df[col].fillna(mean_value)
-                        filled_cols.append(col)
-                print(f"🔸 Filled missing numeric values using mean in columns: {filled_cols}")
-
-            elif strategy == "median":
-                filled_cols = []
-                for col in numerical_cols:
-                    if self.df[col].isnull().any():
-                        median_value = self.df[col].median()
-                        if col in force_int_cols or is_integer_like(self.df[col]):
-                            median_value = round(median_value)
-                            self.df[col] = self.df[col].fillna(median_value).astype(int)
-                        else:
-                            self.df[col] = self.df[col].fillna(median_value)
-                        filled_cols.append(col)
-                print(f"🔸 Filled missing numeric values using median in columns: {filled_cols}")
-
-            elif strategy == "most_frequent":
-                filled_cols = []
-                for col in categorical_cols:
-                    if self.df[col].isnull().any():
-                        mode = self.df[col].mode()
-                        if not mode.empty:
-                            self.df[col].fillna(mode.iloc[0], inplace=True)
-                            filled_cols.append(col)
-                if filled_cols:
-                    print(f"🔸 Filled missing categorical values using mode in columns: {filled_cols}")
-                else:
-                    print("🟢 No categorical missing values filled (no suitable mode found).")
 
-            elif strategy == "drop":
-                before_drop = len(self.df)
-                self.df.dropna(inplace=True)
-                after_drop = len(self.df)
-                print(f"🟢 Dropped rows with missing values: {before_drop - after_drop}")
+        if strategy not in _IMPUTE_STRATEGIES:
+            raise ValueError(
+                "🔴 Invalid strategy. Choose from: 'mean', 'median', 'most_frequent', 'mode', 'constant', "
+                "'drop', 'time', 'nearest', 'ffill', 'bfill' or 'seasonal'."
+            )
+        if strategy in _TIME_STRATEGIES and not isinstance(self.df.index, pd.DatetimeIndex):
+            raise TypeError(
+                f"🔴 Strategy '{strategy}' needs a DatetimeIndex — call set_index_date() first."
+            )
+        if categorical_strategy not in (None, "most_frequent", "mode", "constant"):
+            raise ValueError(
+                "🔴 Invalid categorical_strategy. Choose from: 'most_frequent', 'mode' or 'constant'."
+            )
+        if fill_value is None and "constant" in (strategy, categorical_strategy):
+            raise ValueError("🔴 The 'constant' strategy needs a 'fill_value'.")
+
+        if strategy == "drop":
+            before_drop = len(self.df)
+            self.df.dropna(inplace=True)
+            self._touch()
+            after_drop = len(self.df)
+            print(f"🟢 Dropped rows with missing values: {before_drop - after_drop}")
+        else:
+            # Identify columns with missing values and pick a fill method for each
+            missing_cols = missing_counts.index[missing_counts > 0]
+            if group_by is not None:
+                group_by = _group_list(self.df, group_by)
+                missing_cols = missing_cols.difference(group_by, sort=False)
+            methods = _imputation_methods(self.df[missing_cols], strategy, categorical_strategy)
+            fills, int_cols = self._imputation_values(methods, fill_value, force_int_cols)
+            # Per-group values first; the global value covers groups without one
+            row_fills = self._group_fill_values(methods, group_by, int_cols) if group_by else {}
+            if strategy in _TIME_STRATEGIES:
+                time_fills, time_int_cols = self._time_fill_values(
+                    methods, group_by, max_gap, season, force_int_cols
+                )
+                row_fills.update(time_fills)
+                int_cols += time_int_cols
+            self._apply_fills(fills, int_cols, force_int_cols, row_fills)
+
+            filled = {}
+            for col, method in methods.items():
+                if col in fills or col in row_fills:
+                    filled.setdefault(method, []).append(col)
+            within = f" within groups of {group_by}" if group_by else ""
+            for method, cols in filled.items():
+                print(f"🔸 Filled missing values using {method}{within} in columns: {cols}")
+            if strategy == "most_frequent" and not filled:
+                print("🟢 No categorical missing values filled (no suitable mode found).")
+
+        # Final check
+        remaining_missing = self._null_counts().sum()
+        if remaining_missing == 0:
+            print("🟢 All missing values handled.")
+        else:
+            print(f"🔴 {remaining_missing} missing values still remain after applying strategy '{strategy}'.")
 
-            else:
-                raise ValueError("🔴 Invalid strategy. Choose from: 'mean', 'median', 'drop', or 'most_frequent'.")
+        return self
 
-            # Final check
-            remaining_missing = self.df.isnull().sum().sum()
-            if remaining_missing == 0:
-                print("🟢 All missing values handled.")
+    def _imputation_values(self, methods, fill_value=None, force_int_cols=()):
+        # One fill value per column (statistics come from the cache) and the columns to keep integer
+        fills, int_cols = {}, []
+        for col, method in methods.items():
+            series = self.df[col]
+            if method in _TIME_STRATEGIES:
+                continue  # filled row by row, see _time_fill_values
+            if method == "constant":
+                value = fill_value.get(col) if isinstance(fill_value, dict) else fill_value
+            elif method == "mode":
+                mode = self._column_stat(col, "mode", series.mode)
+                value = mode.iloc[0] if not mode.empty else None
             else:
-                print(f"🔴 {remaining_missing} missing values still remain after applying strategy '{strategy}'.")
+                value = self._column_stat(col, method, getattr(series, method))
+            if value is None or pd.isna(value):
+                continue
+
+            numeric = pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype)
+            if numeric and isinstance(value, (int, float, np.number)):
+                if col in force_int_cols or self._column_stat(col, "integer_like", lambda: _is_integer_like(series)):
+                    value = round(value)
+                    int_cols.append(col)
+            fills[col] = value
+        return fills, int_cols
+
+    def _group_fill_values(self, methods, group_by, int_cols=()):
+        # Per-row fill values from one groupby pass per statistic; NaN where a group has none
+        row_fills = {}
+        for method in ("mean", "median"):
+            cols = [col for col, col_method in methods.items() if col_method == method]
+            if cols:
+                values = self._grouped(self.df[cols], group_by).transform(method)
+                for j, col in enumerate(cols):
+                    row_fills[col] = values.iloc[:, j].to_numpy(dtype=np.float64, na_value=np.nan)
+        mode_cols = [col for col, col_method in methods.items() if col_method == "mode"]
+        if mode_cols:
+            codes = self._grouped(self.df, group_by).ngroup().to_numpy()
+            for col in mode_cols:
+                row_fills[col] = _group_modes(codes, self.df[col])
+        for col in int_cols:
+            if col in row_fills:
+                row_fills[col] = np.round(row_fills[col].astype(np.float64))
+        return row_fills
+
+    def _time_fill_values(self, methods, group_by=None, max_gap=None, season="7D", force_int_cols=()):
+        # Per-row fills from neighbouring timestamps; rows are put in (group, time) order once
+        times = self.df.index.asi8
+        n = len(times)
+        codes = (
+            self._grouped(self.df, group_by).ngroup().to_numpy()
+            if group_by
+            else np.zeros(n, dtype=np.int64)
+        )
+        order = np.lexsort((times, codes))
+        sorted_times, sorted_codes = times[order], codes[order]
+        new_group = np.r_[True, sorted_codes[1:] != sorted_codes[:-1]]
+        positions = np.arange(n)
+        group_start = np.maximum.accumulate(np.where(new_group, positions, 0))
+        group_last = np.minimum.accumulate(
+            np.where(np.r_[new_group[1:], True], positions, n - 1)[::-1]
+        )[::-1]
+        known_time = ~np.isnat(self.df.index.to_numpy()[order])
+        gap = pd.Timedelta(max_gap).value if max_gap is not None else None
+
+        row_fills, int_cols = {}, []
+        for col, method in methods.items():
+            if method not in _TIME_STRATEGIES:
+                continue
+            series = self.df[col]
+            numeric = pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype)
+            values = (_as_array(series) if numeric else series.to_numpy(dtype=object))[order]
+            valid = ~pd.isna(values) & known_time
+            if method == "seasonal":
+                # Same group, one season earlier (e.g. same weekday last week); exact timestamps only
+                lookup = pd.Series(
+                    values[valid],
+                    index=pd.MultiIndex.from_arrays([sorted_codes[valid], sorted_times[valid]]),
+                )
+                lookup = lookup[~lookup.index.duplicated(keep="last")]
+                targets = pd.MultiIndex.from_arrays(
+                    [sorted_codes, sorted_times - pd.Timedelta(season).value]
+                )
+                filled = lookup.reindex(targets).to_numpy()
+            else:
+                filled = _neighbour_fills(
+                    values, valid, sorted_times, group_start, group_last, method, gap
+                )
+            filled[~known_time] = np.nan
+            if numeric and (col in force_int_cols or _is_integer_like(series)):
+                filled = np.round(filled.astype(np.float64))
+                int_cols.append(col)
+            row_fills[col] = np.empty_like(filled)
+            row_fills[col][order] = filled
+        return row_fills, int_cols
+
+    def _apply_fills(self, fills, int_cols=(), force_int_cols=(), row_fills=None):
+        if not fills and not row_fills:
+            return
+        df = self.df
+        # Row-wise fills (one value per row, NaN where there is none) go in positionally
+        for col, values in (row_fills or {}).items():
+            df[col] = df[col].where(df[col].notna(), values)
+
+        # A categorical column only accepts fill values that are among its categories
+        for col, value in fills.items():
+            if isinstance(df[col].dtype, pd.CategoricalDtype) and value not in df[col].cat.categories:
+                df[col] = df[col].cat.add_categories([value])
+
+        df = df.fillna(value=fills)
+        if int_cols:
+            # Nullable integers: no float -> int round trip, and NaN stays representable later on
+            for col in int_cols:
+                values = df[col] if _is_integer_like(df[col]) else np.trunc(df[col])
+                df[col] = _nullable_int(values)
+        self.df = df
+
+    def _null_counts(self):
+        return self._column_stat(None, "null_counts", lambda: self.df.isnull().sum())
+
+    def _subset_key(self, subset):
+        if subset is None:
+            return None
+        return (subset,) if isinstance(subset, str) else tuple(subset)
+
+    def row_fingerprints(self, subset=None):
+        # Computed once per subset and data version; shared by every duplicate check below
+        key = self._subset_key(subset)
+        columns = list(key) if key else self.df.columns
+        values = self._column_stat(
+            key, "fingerprint", lambda: _row_fingerprints(self.df[columns])
+        )
+        return pd.Series(values, index=self.df.index, name="fingerprint")
+
+    def _duplicate_mask(self, subset=None, keep="first"):
+        def compute():
+            fingerprints = pd.Series(self.row_fingerprints(subset).to_numpy())
+            # Only rows sharing a fingerprint can be duplicates; confirm those exactly
+            candidates = fingerprints.duplicated(keep=False).to_numpy()
+            mask = np.zeros(len(fingerprints), dtype=bool)
+            if candidates.any():
+                mask[candidates] = self.df[candidates].duplicated(subset=subset, keep=keep).to_numpy()
+            return mask
+
+        return self._column_stat(self._subset_key(subset), ("duplicated", keep), compute)
+
+    def contains_rows(self, rows, subset=None):
+        # Fingerprint lookup by binary search, then an exact comparison of the matches
+        key = self._subset_key(subset)
+        columns = list(key) if key else list(self.df.columns)
+        rows = pd.DataFrame(rows)
+        missing = [col for col in columns if col not in rows.columns]
+        if missing:
+            raise ValueError(f"🔴 Rows are missing column(s): {missing}")
+        existing = self.df[columns]
+        rows = rows[columns].astype(
+            {
+                col: dtype
+                for col, dtype in existing.dtypes.items()
+                if not isinstance(dtype, pd.CategoricalDtype) and rows[col].dtype != dtype
+            }
+        )
 
-            return self
+        fingerprints = self.row_fingerprints(subset).to_numpy()
+        order = self._column_stat(key, "fingerprint_order", lambda: np.argsort(fingerprints, kind="stable"))
+        sorted_prints = fingerprints[order]
+        wanted = _row_fingerprints(rows)
+        slots = np.minimum(np.searchsorted(sorted_prints, wanted), max(len(order) - 1, 0))
+        found = (sorted_prints[slots] == wanted) if len(order) else np.zeros(len(rows), dtype=bool)
+
+        if found.any():
+            matches = existing.iloc[order[slots[found]]]
+            candidates = rows[found]
+            same = np.ones(int(found.sum()), dtype=bool)
+            for col in columns:
+                left, right = matches[col].to_numpy(), candidates[col].to_numpy()
+                same &= (left == right) | (pd.isna(left) & pd.isna(right))
+            found[found] = same
+        return found
 
     def inspect_duplicates(self, subset=None, keep=False, return_rows=False):
-        dups = self.df[self.df.duplicated(subset=subset, keep=keep)]
+        dups = self.df[self._duplicate_mask(subset, keep)]
         num_dups = len(dups)
 
         if num_dups > 0:
@@ -308,7 +2364,7 @@ class DataProcessor:
             return num_dups
 
     def handle_duplicates(self, method="keep_first"):
-        duplicates = self.df.duplicated()
+        duplicates = self._duplicate_mask()
         num_duplicates = duplicates.sum()
 
         if num_duplicates == 0:
@@ -320,10 +2376,10 @@ class DataProcessor:
         )
 
         if method == "keep_first":
-            self.df.drop_duplicates(keep="first", inplace=True)
+            self.df = self.df[~duplicates]
             print("🔸 Kept first occurrence of duplicates.")
         elif method == "keep_last":
-            self.df.drop_duplicates(keep="last", inplace=True)
+            self.df = self.df[~self._duplicate_mask(keep="last")]
             print("🔸 Kept last occurrence of duplicates.")
         elif method == "drop_all":
             self.df = self.df[~duplicates]
@@ -333,12 +2389,13 @@ class DataProcessor:
             print("🔸 Flagged duplicate rows in 'is_duplicate' column.")
         else:
             raise ValueError(f"🔴 Unknown duplicate handling method: '{method}'")
+        self._touch()
         return self
 
     def log_duplicates(
         self, subset=None, keep=False, log_dir="logs", filename=None, file_format="csv"
     ):
-        duplicates = self.df[self.df.duplicated(subset=subset, keep=keep)]
+        duplicates = self.df[self._duplicate_mask(subset, keep)]
         num_dups = len(duplicates)
 
         if num_dups == 0:
@@ -370,7 +2427,124 @@ class DataProcessor:
         print(f"🔴 Logged {num_dups} duplicate rows to: {file_path}")
         return file_path
         
-    def inspect_duplicate_columns(self):
+    def inspect_near_duplicates(
+        self,
+        numeric_cols=None,
+        string_cols=None,
+        exact_cols=None,
+        tolerance=0.01,
+        similarity=0.5,
+        num_perm=64,
+        bands=32,
+        shingle_size=2,
+        window=50,
+        random_state=0,
+    ):
+        if num_perm % bands:
+            raise ValueError("🔴 num_perm must be a multiple of bands.")
+        df = self.df
+        n = len(df)
+        exact_cols = [exact_cols] if isinstance(exact_cols, str) else list(exact_cols or [])
+        if numeric_cols is None:
+            # Integer columns (IDs, receipt numbers, counters) usually differ between copies of a record
+            numeric_cols = [col for col in df.columns[_numeric_positions(df)] if col not in exact_cols]
+            skipped = [col for col in numeric_cols if pd.api.types.is_integer_dtype(df[col].dtype)]
+            numeric_cols = [col for col in numeric_cols if col not in skipped]
+            if skipped:
+                print(f"🔸 Integer columns not compared (likely keys or counters): {skipped}")
+        if string_cols is None:
+            string_cols = [
+                col
+                for col in df.select_dtypes(include=["object", "category"]).columns
+                if col not in exact_cols and not (n > 1 and df[col].nunique() == n)
+            ]
+        numeric_cols, string_cols = list(numeric_cols), list(string_cols)
+
+        # 1. Row features: exact-column hash, numeric values, per-column MinHash of the distinct strings
+        exact_key = _row_fingerprints(df[exact_cols]) if exact_cols else np.zeros(n, dtype=np.uint64)
+        numeric = [_as_array(df[col]).astype(np.float64, copy=False) for col in numeric_cols]
+        tolerances = [
+            tolerance.get(col, 0.01) if isinstance(tolerance, dict) else tolerance for col in numeric_cols
+        ]
+        codes, signatures = [], []
+        for col in string_cols:
+            col_codes, uniques = pd.factorize(df[col])
+            codes.append(np.where(col_codes < 0, len(uniques), col_codes))
+            signatures.append(_minhash_signatures(uniques, num_perm, shingle_size, random_state))
+        if string_cols:
+            # Rows with the same strings share a combination; signatures and similarities are
+            # computed per combination (MinHash of a union = element-wise min of the signatures)
+            combo = codes[0] if len(codes) == 1 else pd.factorize(_row_fingerprints(pd.DataFrame(codes).T))[0]
+            num_combos = combo.max() + 1 if n else 0
+            first = np.empty(num_combos, dtype=np.int64)
+            first[combo[::-1]] = np.arange(n)[::-1]
+            combo_signatures = np.minimum.reduce([sig[code[first]] for code, sig in zip(codes, signatures)])
+
+        def verify(left, right):
+            # Exact columns equal, numbers within tolerance, strings similar enough
+            match = exact_key[left] == exact_key[right]
+            for values, tol in zip(numeric, tolerances):
+                a, b = values[left], values[right]
+                match &= (np.abs(a - b) <= tol) | (np.isnan(a) & np.isnan(b))
+            if string_cols and match.any():
+                pair_ids, inverse = np.unique(
+                    combo[left[match]] * num_combos + combo[right[match]], return_inverse=True
+                )
+                a, b = combo_signatures[pair_ids // num_combos], combo_signatures[pair_ids % num_combos]
+                match[match] = (a == b).mean(axis=1)[inverse] >= similarity
+            return left[match], right[match]
+
+        # 2. Candidates: rows sharing a bucket key in some pass. Each pass buckets every numeric
+        # column on its own randomly shifted grid and keys on one LSH band of the string signatures.
+        # Candidates are verified pass by pass and the matches reduced to a spanning forest, so
+        # memory stays proportional to the clustered rows.
+        rng = np.random.default_rng(random_state)
+        rows_per_band = num_perm // bands
+        tiebreak = numeric[0] if numeric else None
+        left = right = np.empty(0, dtype=np.int64)
+        for p in range(bands):
+            parts = {"exact": exact_key}
+            for j, (values, tol) in enumerate(zip(numeric, tolerances)):
+                bucket = np.floor(values / (_NEAR_BUCKET_WIDTH * tol) + rng.random())
+                parts[f"n{j}"] = np.where(np.isnan(bucket), np.iinfo(np.int64).min, bucket).astype(np.int64)
+            if string_cols:
+                band = combo_signatures[:, p * rows_per_band : (p + 1) * rows_per_band][combo]
+                for i in range(rows_per_band):
+                    parts[f"s{i}"] = band[:, i]
+            key = _row_fingerprints(pd.DataFrame(parts))
+            matched_left, matched_right = verify(*_bucket_pairs(key, window, tiebreak))
+            left, right = _spanning_forest(
+                np.concatenate([left, matched_left]), np.concatenate([right, matched_right])
+            )
+
+        # 3. Clusters of likely duplicates (the forest links each row to its cluster's first row)
+        nodes = np.unique(np.concatenate([left, right]))
+        roots = nodes.copy()
+        roots[np.searchsorted(nodes, left)] = right
+        cluster_ids = pd.factorize(roots)[0]
+        clusters = df.iloc[nodes].assign(near_duplicate_cluster=cluster_ids)
+        clusters = clusters.sort_values("near_duplicate_cluster", kind="stable")
+
+        if len(nodes):
+            print(
+                f"🔴 Found {cluster_ids.max() + 1} cluster(s) of near-duplicate rows ({len(nodes)} rows)."
+            )
+        else:
+            print("🟢 No near-duplicate rows found.")
+        return clusters
+
+    def inspect_duplicate_columns(self, by_content=False):
+        if by_content:
+            redundant = self._content_duplicate_positions()
+            duplicates = self.df.columns[list(redundant)].tolist()
+            if duplicates:
+                print(f"🔴 Found {len(duplicates)} column(s) with the same content as an earlier column:")
+                for position, match in redundant.items():
+                    print(f"🔸 {self.df.columns[position]} == {self.df.columns[match]}")
+            else:
+                print("🟢 No columns with duplicate content found.")
+            return duplicates
+
         duplicates = self.df.columns[self.df.columns.duplicated()].tolist()
         if duplicates:
             print(f"🔴 Found {len(duplicates)} duplicate column(s): {duplicates}")
@@ -378,7 +2552,21 @@ class DataProcessor:
             print("🟢 No duplicate columns found.")
         return duplicates
         
-    def handle_duplicate_columns(self, keep="first"):
+    def handle_duplicate_columns(self, keep="first", by_content=False):
+        if by_content:
+            if keep not in ["first", "last"]:
+                raise ValueError("keep must be 'first' or 'last'.")
+            redundant = self._content_duplicate_positions(keep)
+            if not redundant:
+                print("🟢 No columns with duplicate content to handle.")
+                return self
+            dropped = self.df.columns[list(redundant)].tolist()
+            print(f"🔴 Removing {len(dropped)} column(s) with duplicate content: {dropped}. Keeping: {keep}")
+            mask = np.ones(self.df.shape[1], dtype=bool)
+            mask[list(redundant)] = False
+            self.df = self.df.iloc[:, mask]
+            return self
+
         duplicates = self.df.columns[self.df.columns.duplicated(keep=False)]
         if not duplicates.any():
             print("🟢 No duplicate columns to handle.")
@@ -391,26 +2579,36 @@ class DataProcessor:
         self.df = self.df.loc[:, ~self.df.columns.duplicated(keep=keep)]
         return self
 
-    def check_outliers(self, z_thresh=2, return_rows=False, log_path=None):
-        numeric_df = self.df.select_dtypes(include="number")
+    def check_outliers(self, z_thresh=2, return_rows=False, log_path=None, group_by=None):
+        if group_by is not None:
+            group_by = _group_list(self.df, group_by)
+        positions, arrays, stats, counts, any_outlier, _ = self._zscore_outliers(z_thresh, group_by)
+        numeric_cols = self.df.columns[positions]
         print("\n🟢 Numeric columns used for Z-score calculation:")
-        print(numeric_df.columns)
+        print(numeric_cols)
+        if group_by:
+            print(f"🔸 Z-scores computed within groups of {group_by}")
     
-        z_scores = numeric_df.apply(zscore)
+        # Z-scores are computed block by block over the column arrays (memory-mapped or not)
+        sample_z = pd.DataFrame(
+            {
+                j: _zscores(values[:5], _rows(stats[j][0], 0, 5), _rows(stats[j][1], 0, 5))
+                for j, values in enumerate(arrays)
+            },
+            index=self.df.index[:5],
+        )
+        sample_z.columns = numeric_cols
         print("\n🟢 Sample Z-scores:")
-        print(z_scores.head())
-    
-        # Identify boolean DataFrame of outliers
-        is_outlier = z_scores.abs() > z_thresh
+        print(sample_z)
     
         # Count outliers per column
-        outliers_count = is_outlier.sum()
+        outliers_count = pd.Series(counts, index=numeric_cols)
         print("\n🟢 Outliers per column (Z-score > threshold):")
         print(outliers_count[outliers_count > 0])
     
         if return_rows:
             # Combine with original DataFrame to show full rows that contain outliers
-            outlier_rows = self.df[is_outlier.any(axis=1)]
+            outlier_rows = self.df[any_outlier]
             print(f"\n🔸 Rows with at least one outlier (Z > {z_thresh}):")
             print(outlier_rows)
             
@@ -428,16 +2626,21 @@ class DataProcessor:
         else:
             return outliers_count    
 
-    def remove_outliers_zscore(self, z_thresh=2):
-        numeric_df = self.df.select_dtypes(include="number")
-        z_scores = numeric_df.apply(zscore)
-        mask = (z_scores.abs() < z_thresh).all(axis=1)
-        self.df = self.df[mask]
-        print(f"🟢 Removed outliers using Z-score threshold = {z_thresh}")
+    def remove_outliers_zscore(self, z_thresh=2, group_by=None):
+        if group_by is not None:
+            group_by = _group_list(self.df, group_by)
+        *_, all_inside = self._zscore_outliers(z_thresh, group_by)
+        self.df = self.df[all_inside]
+        within = f" within groups of {group_by}" if group_by else ""
+        print(f"🟢 Removed outliers using Z-score threshold = {z_thresh}{within}")
         return self
 
     def remove_outliers_from_column(self, column, z_thresh=2):
-        z = zscore(self.df[column].dropna())
+        values = _as_array(self.df[column].dropna())
+        z = _zscores(
+            values,
+            *self._column_stat(column, "mean_std_dropna", lambda: _block_mean_std(values)),
+        )
         mask = abs(z) < z_thresh
 
         filtered_df = self.df.loc[self.df[column].dropna().index[mask]]
@@ -453,29 +2656,42 @@ class DataProcessor:
         self.df = filtered_df  # Update the internal DataFrame
         return self
 
-    def remove_outliers_iqr(self, column, iqr_multiplier=1.5, return_rows=False, log_path=None):
+    def remove_outliers_iqr(
+        self, column, iqr_multiplier=1.5, return_rows=False, log_path=None, group_by=None
+    ):
         if column not in self.df.columns:
             print(f"🔴 Column '{column}' not found in the dataset.")
             return self
 	    
-        q1 = self.df[column].quantile(0.25)
-        q3 = self.df[column].quantile(0.75)
+        values = _as_array(self.df[column])
+        if group_by is not None:
+            # Quartiles of each row's group, from one grouped quantile pass each
+            group_by = _group_list(self.df, group_by)
+            grouped = self._grouped(self.df[column], group_by)
+            q1, q3 = self._column_stat(
+                column,
+                ("group_quartiles", tuple(group_by)),
+                lambda: tuple(
+                    grouped.transform("quantile", q).to_numpy(dtype=np.float64, na_value=np.nan)
+                    for q in (0.25, 0.75)
+                ),
+            )
+        else:
+            q1, q3 = self._column_stat(
+                column, "quartiles", lambda: np.nanquantile(values, [0.25, 0.75])
+            )
         iqr = q3 - q1
 	    
         lower_bound = q1 - iqr_multiplier * iqr
         upper_bound = q3 + iqr_multiplier * iqr
 	    
         # Identify outliers
-        outliers = self.df[
-            (self.df[column] < lower_bound) | (self.df[column] > upper_bound)
-        ]
+        outliers = self.df[(values < lower_bound) | (values > upper_bound)]
 	    
         before_rows = self.df.shape[0]
         
         # Remove outliers
-        self.df = self.df[
-            (self.df[column] >= lower_bound) & (self.df[column] <= upper_bound)
-        ]
+        self.df = self.df[(values >= lower_bound) & (values <= upper_bound)]
         after_rows = self.df.shape[0]
         removed = before_rows - after_rows
 	    
@@ -505,6 +2721,9 @@ class DataProcessor:
         return self.df
 
     def visualize_outliers_boxplot(self, original_df, cleaned_df, column):
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         fig, axes = plt.subplots(1, 2, figsize=(12, 5), sharey=True)
 
         sns.boxplot(y=original_df[column], ax=axes[0], color="salmon")
@@ -519,6 +2738,9 @@ class DataProcessor:
         plt.show()
 
     def visualize_outliers_histogram(self, original_df, cleaned_df, column):
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         plt.figure(figsize=(12, 5))
 
         sns.histplot(
@@ -545,18 +2767,360 @@ class DataProcessor:
 
     def run_all_checks(self):
         print("\n🔹 Running data quality checks...")
+        if self.sample_info:
+            self.sample_report()
         self.check_missing()
         self.inspect_duplicates()
         self.check_dtypes()
         self.check_index_is_datetime()
         return self
 
-    def save(self, path, format="csv"):
-        if format == "csv":
-            self.df.to_csv(path)
+    def save(
+        self,
+        path,
+        format="csv",
+        append=False,
+        compression="infer",
+        workers=None,
+        table=None,
+        if_exists=None,
+        upsert_on=None,
+        batch_size=_SQL_BATCH_ROWS,
+    ):
+        if format == "sqlite":
+            # Upserts update an existing table, so they append unless told otherwise
+            if upsert_on is not None and if_exists == "replace":
+                raise ValueError("🔴 upsert_on can't be combined with if_exists='replace'.")
+            if append or (if_exists is None and upsert_on is not None):
+                if_exists = "append"
+            table = table or self.table or Path(path).stem
+            _save_sqlite(
+                self.df,
+                path,
+                table,
+                if_exists=if_exists or "replace",
+                upsert_on=upsert_on,
+                batch_size=batch_size,
+            )
+            print(f"🟢 Data saved to {path} (table '{table}')")
+            return self
+
+        if compression == "infer":
+            compression = _COMPRESSION_SUFFIXES.get(Path(path).suffix)
+        if compression and compression not in _COMPRESSION_SUFFIXES.values():
+            raise ValueError(
+                f"🔴 Unsupported compression '{compression}'. Use 'gzip', 'bz2', 'xz' or 'zip'."
+            )
+        if compression and format != "csv":
+            raise ValueError("🔴 Compression is only supported for 'csv' format.")
+
+        if format == "csv" and compression in _BLOCK_COMPRESSORS:
+            # Render blocks of rows and compress them in parallel
+            blocks = (
+                self.df.iloc[start : start + _SAVE_BLOCK_ROWS]
+                .to_csv(header=start == 0 and not append)
+                .encode()
+                for start in range(0, max(len(self.df), 1), _SAVE_BLOCK_ROWS)
+            )
+            _write_compressed(blocks, path, compression, append=append, workers=workers)
+        elif format == "csv" and compression == "zip":
+            if append:
+                raise ValueError("🔴 Appending to a zip archive is not supported.")
+            self.df.to_csv(path, compression="zip")
+        elif format == "csv":
+            self.df.to_csv(path, mode="a" if append else "w", header=not append)
+        elif append:
+            raise ValueError("🔴 Appending is only supported for 'csv' format.")
         elif format == "xlsx":
             self.df.to_excel(path)
         else:
-            raise ValueError("🔴 Unsupported format. Use 'csv' or 'xlsx'.")
+            raise ValueError("🔴 Unsupported format. Use 'csv', 'xlsx' or 'sqlite'.")
         print(f"🟢 Data saved to {path}")
         return self
+
+
+class Imputer:
+    # Fill values learned once (e.g. on a training snapshot) and applied unchanged to later batches
+    def __init__(self, strategy="mean", categorical_strategy=None, fill_value=None, force_int_cols=None):
+        if strategy not in _IMPUTE_STRATEGIES or strategy in ("drop", *_TIME_STRATEGIES):
+            raise ValueError(
+                "🔴 Invalid strategy. Choose from: 'mean', 'median', 'most_frequent', 'mode' or 'constant'."
+            )
+        self.strategy = strategy
+        self.categorical_strategy = categorical_strategy
+        self.fill_value = fill_value
+        self.force_int_cols = list(force_int_cols or [])
+        self.fill_values = None
+        self.int_columns = None
+
+    def fit(self, processor):
+        methods = _imputation_methods(processor.df, self.strategy, self.categorical_strategy)
+        self.fill_values, self.int_columns = processor._imputation_values(
+            methods, self.fill_value, self.force_int_cols
+        )
+        print(f"🟢 Imputer fitted on {len(self.fill_values)} column(s).")
+        return self
+
+    def transform(self, processor):
+        if self.fill_values is None:
+            raise RuntimeError("🔴 Imputer is not fitted. Call fit() or Imputer.load() first.")
+        df = processor.df
+        fills = {}
+        for col, value in self.fill_values.items():
+            if col not in df.columns or not df[col].hasnans:
+                continue
+            if pd.api.types.is_datetime64_any_dtype(df[col]) and isinstance(value, str):
+                value = pd.Timestamp(value)
+            fills[col] = value
+        int_cols = [col for col in self.int_columns if col in fills]
+        processor._apply_fills(fills, int_cols, self.force_int_cols)
+        print(f"🟢 Filled missing values in {len(fills)} column(s) with fitted values.")
+        return processor
+
+    def fit_transform(self, processor):
+        return self.fit(processor).transform(processor)
+
+    def save(self, path):
+        state = {
+            "strategy": self.strategy,
+            "categorical_strategy": self.categorical_strategy,
+            "force_int_cols": self.force_int_cols,
+            "fill_values": {col: _json_scalar(value) for col, value in self.fill_values.items()},
+            "int_columns": self.int_columns,
+        }
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(json.dumps(state, indent=2))
+        print(f"🟢 Imputer saved to {path}")
+        return self
+
+    @classmethod
+    def load(cls, path):
+        state = json.loads(Path(path).read_text())
+        imputer = cls(state["strategy"], state["categorical_strategy"], force_int_cols=state["force_int_cols"])
+        imputer.fill_values = state["fill_values"]
+        imputer.int_columns = state["int_columns"]
+        return imputer
+
+
+_SCALER_METHODS = ("standard", "minmax", "robust")
+
+
+class Scaler:
+    # Same parameters as scikit-learn's StandardScaler, MinMaxScaler and RobustScaler (NaN ignored)
+    def __init__(self, method="standard", columns=None):
+        if method not in _SCALER_METHODS:
+            raise ValueError("🔴 Invalid method. Choose from: 'standard', 'minmax' or 'robust'.")
+        self.method = method
+        self.columns = list(columns) if columns is not None else None
+        self.center = None
+        self.scale = None
+
+    def fit(self, processor):
+        df = processor.df
+        columns = self.columns or list(df.columns[_numeric_positions(df)])
+        center, scale = [], []
+        for col in columns:
+            values = _as_array(df[col])
+            if self.method == "standard":
+                c, spread = processor._column_stat(
+                    col, "mean_std_skipna", lambda: (np.nanmean(values), np.nanstd(values))
+                )
+            elif self.method == "minmax":
+                c, high = processor._column_stat(
+                    col, "min_max", lambda: (np.nanmin(values), np.nanmax(values))
+                )
+                spread = high - c
+            else:
+                c, q1, q3 = processor._column_stat(
+                    col, "median_quartiles", lambda: np.nanquantile(values, [0.5, 0.25, 0.75])
+                )
+                spread = q3 - q1
+            center.append(float(c))
+            scale.append(float(spread) if spread else 1.0)  # constant columns are only shifted
+        self.columns = columns
+        self.center = np.array(center)
+        self.scale = np.array(scale)
+        print(f"🟢 Scaler ('{self.method}') fitted on {len(columns)} column(s).")
+        return self
+
+    def _scaled_block(self, processor):
+        if self.center is None:
+            raise RuntimeError("🔴 Scaler is not fitted. Call fit() or Scaler.load() first.")
+        missing = [col for col in self.columns if col not in processor.df.columns]
+        if missing:
+            raise ValueError(f"🔴 Columns missing from the batch: {missing}")
+        return processor.df[self.columns].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    def transform(self, processor):
+        # One broadcast over the whole numeric block
+        values = self._scaled_block(processor)
+        processor.df[self.columns] = (values - self.center) / self.scale
+        processor._touch()
+        print(f"🟢 Scaled {len(self.columns)} column(s) with fitted '{self.method}' parameters.")
+        return processor
+
+    def inverse_transform(self, processor):
+        values = self._scaled_block(processor)
+        processor.df[self.columns] = values * self.scale + self.center
+        processor._touch()
+        return processor
+
+    def fit_transform(self, processor):
+        return self.fit(processor).transform(processor)
+
+    def save(self, path):
+        state = {
+            "method": self.method,
+            "columns": self.columns,
+            "center": self.center.tolist(),
+            "scale": self.scale.tolist(),
+        }
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(json.dumps(state, indent=2))
+        print(f"🟢 Scaler saved to {path}")
+        return self
+
+    @classmethod
+    def load(cls, path):
+        state = json.loads(Path(path).read_text())
+        scaler = cls(state["method"], state["columns"])
+        scaler.center = np.array(state["center"])
+        scaler.scale = np.array(state["scale"])
+        return scaler
+
+
+class DuplicateFilter:
+    # Bloom filter over row fingerprints, backed by the sorted fingerprints for exact confirmation
+    def __init__(self, capacity=10_000_000, error_rate=0.01, max_bytes=None, subset=None):
+        bits = int(np.ceil(-capacity * np.log(error_rate) / np.log(2) ** 2))
+        if max_bytes is not None:
+            bits = min(bits, int(max_bytes) * 8)  # a smaller filter trades memory for more false positives
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.subset = [subset] if isinstance(subset, str) else subset
+        self.num_bits = max(bits, 64)
+        self.num_hashes = max(int(round(self.num_bits / capacity * np.log(2))), 1)
+        self.bits = np.zeros((self.num_bits + 7) // 8, dtype=np.uint8)
+        self.fingerprints = np.empty(0, dtype=np.uint64)
+        self.checks = np.empty(0, dtype=np.uint64)
+
+    def _keys(self, processor):
+        df = processor.df
+        return _stream_fingerprints(df[self.subset] if self.subset else df)
+
+    def _positions(self, fingerprint, check):
+        # Double hashing: bit i of a key is (h1 + i * h2) mod m
+        step = check | np.uint64(1)
+        rounds = np.arange(self.num_hashes, dtype=np.uint64)[:, None]
+        return (fingerprint[None, :] + rounds * step[None, :]) % np.uint64(self.num_bits)
+
+    def _maybe_seen(self, fingerprint, check):
+        positions = self._positions(fingerprint, check)
+        hits = (self.bits[positions >> np.uint64(3)] >> (positions & np.uint64(7)).astype(np.uint8)) & 1
+        return hits.all(axis=0).astype(bool)
+
+    def _confirm(self, fingerprint, check):
+        if not len(self.fingerprints):
+            return np.zeros(len(fingerprint), dtype=bool)
+        slots = np.minimum(np.searchsorted(self.fingerprints, fingerprint), len(self.fingerprints) - 1)
+        return (self.fingerprints[slots] == fingerprint) & (self.checks[slots] == check)
+
+    def contains(self, processor):
+        # Filter first; only its (rare) hits are looked up in the stored keys
+        fingerprint, check = self._keys(processor)
+        seen = self._maybe_seen(fingerprint, check)
+        if seen.any():
+            seen[seen] = self._confirm(fingerprint[seen], check[seen])
+        return seen
+
+    def _add_keys(self, fingerprint, check):
+        new = ~self._confirm(fingerprint, check)
+        fingerprint, check = fingerprint[new], check[new]
+        keys = pd.DataFrame({"fingerprint": fingerprint, "check": check})
+        keep = ~keys.duplicated().to_numpy()
+        fingerprint, check = fingerprint[keep], check[keep]
+        if not len(fingerprint):
+            return 0
+
+        positions = self._positions(fingerprint, check).ravel()
+        np.bitwise_or.at(
+            self.bits,
+            (positions >> np.uint64(3)).astype(np.int64),
+            (np.uint8(1) << (positions & np.uint64(7)).astype(np.uint8)),
+        )
+        # Merge into the sorted key arrays in one insert (no full re-sort)
+        order = np.argsort(fingerprint, kind="stable")
+        fingerprint, check = fingerprint[order], check[order]
+        slots = np.searchsorted(self.fingerprints, fingerprint)
+        self.fingerprints = np.insert(self.fingerprints, slots, fingerprint)
+        self.checks = np.insert(self.checks, slots, check)
+        return len(fingerprint)
+
+    def add(self, processor):
+        added = self._add_keys(*self._keys(processor))
+        print(f"🟢 Added {added} new row key(s) to the duplicate filter ({len(self.fingerprints)} in total).")
+        return self
+
+    def drop_seen(self, processor, add=True):
+        # Remove rows seen in earlier batches, then remember the rest
+        fingerprint, check = self._keys(processor)
+        maybe = self._maybe_seen(fingerprint, check)
+        seen = maybe.copy()
+        if maybe.any():
+            seen[maybe] = self._confirm(fingerprint[maybe], check[maybe])
+        if seen.any():
+            processor.df = processor.df[~seen]
+        if add:
+            self._add_keys(fingerprint[~seen], check[~seen])
+        print(
+            f"🟢 Screened {len(seen)} row(s): {int(seen.sum())} seen before "
+            f"({int(maybe.sum() - seen.sum())} filter false positive(s))."
+        )
+        return processor
+
+    def info(self):
+        # Expected false-positive rate at the current fill, from the standard Bloom filter formula
+        items = len(self.fingerprints)
+        expected = (1 - np.exp(-self.num_hashes * items / self.num_bits)) ** self.num_hashes
+        return {
+            "items": items,
+            "capacity": self.capacity,
+            "bits": self.num_bits,
+            "hashes": self.num_hashes,
+            "filter_bytes": self.bits.nbytes,
+            "key_bytes": self.fingerprints.nbytes + self.checks.nbytes,
+            "false_positive_rate": float(expected),
+        }
+
+    def save(self, directory):
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / "bits.npy", self.bits)
+        np.save(directory / "fingerprints.npy", self.fingerprints)
+        np.save(directory / "checks.npy", self.checks)
+        meta = {
+            "capacity": self.capacity,
+            "error_rate": self.error_rate,
+            "subset": self.subset,
+            "num_bits": self.num_bits,
+            "num_hashes": self.num_hashes,
+        }
+        (directory / "meta.json").write_text(json.dumps(meta))
+        print(f"🟢 Duplicate filter saved to {directory}")
+        return self
+
+    @classmethod
+    def load(cls, directory, mmap_mode=None):
+        # mmap_mode="r" leaves the stored keys on disk; lookups then only touch the pages they need
+        directory = Path(directory)
+        meta = json.loads((directory / "meta.json").read_text())
+        duplicate_filter = cls.__new__(cls)  # skip allocating an empty bit array
+        duplicate_filter.capacity = meta["capacity"]
+        duplicate_filter.error_rate = meta["error_rate"]
+        duplicate_filter.subset = meta["subset"]
+        duplicate_filter.num_bits = meta["num_bits"]
+        duplicate_filter.num_hashes = meta["num_hashes"]
+        duplicate_filter.bits = np.load(directory / "bits.npy")
+        duplicate_filter.fingerprints = np.load(directory / "fingerprints.npy", mmap_mode=mmap_mode)
+        duplicate_filter.checks = np.load(directory / "checks.npy", mmap_mode=mmap_mode)
+        return duplicate_filter
@@ -0,0 +1,47 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from processor import DataProcessor, FileCache
+
+
+def _frame():
+    return pd.DataFrame(
+        {
+            "amount": [1.5, np.nan, 3.0, 4.25],
+            "manager": ["Alice", np.nan, "Bob", "Alice"],
+            "store": pd.Categorical(["a", "b", "a", None]),
+            "code": pd.Categorical([10, 20, 10, 20]),
+            "mixed": [1, "x", 2.5, np.nan],
+            "day": [date(2025, 3, 1), date(2025, 3, 2), np.nan, date(2025, 3, 1)],
+            "count": pd.array([1, None, 3, 4], dtype="Int64"),
+            "label": pd.array(["x", None, "z", "x"], dtype="string"),
+            "at": pd.to_datetime(["2025-03-01", None, "2025-03-03", "2025-03-04"]).tz_localize("UTC"),
+        }
+    )
+
+
+def test_round_trip_without_pickle(tmp_path):
+    df = _frame()
+    processor = DataProcessor(dataset=df.copy()).use_memmap(tmp_path)
+
+    pd.testing.assert_frame_equal(processor.df, df)
+    for path in tmp_path.glob("*.npy"):
+        # Every stored array loads with pickling disabled
+        np.load(path, allow_pickle=False)
+
+
+def test_cache_treats_old_layout_as_miss(tmp_path):
+    cache = FileCache(tmp_path)
+    cache.put("key", _frame())
+    meta = tmp_path / "key" / "meta.json"
+    meta.write_text(meta.read_text().replace('"format": 2', '"format": 1'))
+    assert cache.get("key") is None
+
+
+def test_cache_skips_values_it_cannot_store(tmp_path):
+    cache = FileCache(tmp_path)
+    df = pd.DataFrame({"value": [object(), object()]})
+    assert cache.put("key", df) is None
+    assert cache.get("key") is None
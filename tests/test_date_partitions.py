@@ -0,0 +1,62 @@
+import pandas as pd
+import pytest
+
+from processor import DataProcessor, _in_date_range, _partition_span
+
+MARCH = ("2025-03-01", "2025-03-31")
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "sales/2025-03-01/store_2001.csv",
+        "sales_2025-03-01_store_1950.csv",
+        "sales/20250301/store_1999.csv",
+        "sales/2025/03/01/store_2150.csv",
+        "sales/date=2025-03-01/store_2001.csv",
+        "sales/year=2025/month=03/store_2001.csv",
+    ],
+)
+def test_store_numbers_are_not_read_as_years(path):
+    assert _in_date_range(path, *MARCH)
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "sales/2025-04-01/store_2001.csv",
+        "sales_20250401.csv",
+        "sales/year=2025/month=04/part.csv",
+        "sales/date=2024-03-01/part.csv",
+    ],
+)
+def test_partitions_outside_the_range_are_skipped(path):
+    assert not _in_date_range(path, *MARCH)
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "sales/store_2001.csv",  # a bare number is no date
+        "sales_2024-11.csv",  # month-only names need a date_pattern
+        "sales/2025-03-01/export_2025-04-02.csv",  # dates that disagree
+        "sales/date=yesterday/part.csv",
+    ],
+)
+def test_files_without_a_clear_date_are_kept(path):
+    assert _partition_span(path) is None
+
+
+def test_caller_pattern(tmp_path):
+    for month in ("03", "04"):
+        pd.DataFrame({"ID": [int(month)]}).to_csv(tmp_path / f"sales_2025-{month}.csv", index=False)
+    processor = DataProcessor(filepath=str(tmp_path / "sales_*.csv")).load(
+        date_range=MARCH, date_pattern=r"sales_(?P<year>\d{4})-(?P<month>\d{2})"
+    )
+    assert processor.df["ID"].tolist() == [3]
+
+
+def test_pattern_without_year_is_refused(tmp_path):
+    pd.DataFrame({"ID": [1]}).to_csv(tmp_path / "sales.csv", index=False)
+    with pytest.raises(ValueError):
+        DataProcessor(filepath=tmp_path / "sales.csv").load(date_range=MARCH, date_pattern=r"(\d{4})")
@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+
+from processor import DataProcessor, _guess_date_format, _parse_dates_cached
+
+
+def test_format_ties_go_to_the_first_format_seen():
+    assert _guess_date_format(["2025-03-04", "2025/03/05"]) == "%Y-%m-%d"
+    assert _guess_date_format(["2025/03/05", "2025-03-04"]) == "%Y/%m/%d"
+
+
+def test_strict_parse_rejects_values_off_the_format():
+    series = pd.Series(["2025-03-01", "2025-03-02", "not a date"])
+    parsed, _ = _parse_dates_cached(series)
+    assert parsed is None
+
+
+def test_lenient_parse_falls_back_per_value():
+    series = pd.Series(["2025-03-01", "2025-03-01", "March 2, 2025", "not a date", None])
+    parsed, date_format = _parse_dates_cached(series, strict=False)
+
+    assert date_format == "%Y-%m-%d"
+    expected = pd.to_datetime(["2025-03-01", "2025-03-01", "2025-03-02", None, None])
+    np.testing.assert_array_equal(parsed.to_numpy(), expected.to_numpy())
+
+
+def test_set_index_date_matches_to_datetime():
+    dates = ["2025-03-01", "2025-03-02", "2025-03-01", "2025-03-03"]
+    df = pd.DataFrame({"DATE": dates, "TOTAL_SALES": [1.0, 2.0, 3.0, 4.0]})
+    processor = DataProcessor(dataset=df).set_index_date("DATE")
+    assert processor.df.index.equals(pd.DatetimeIndex(pd.to_datetime(dates), name="DATE"))
@@ -0,0 +1,41 @@
+import pandas as pd
+import pytest
+
+from processor import DataProcessor
+
+WIDE = 1234567890123456789  # IDs this wide are not exact as float64
+CSV = "\n".join(
+    [
+        "ID,v,amount",
+        f"{WIDE},1,1",
+        f"{WIDE + 1},1,2",
+        f"{WIDE + 2},1,1",
+        f"{WIDE},1,1",
+        f"{WIDE + 1},1,2.0",  # same as row 2, but this chunk parses 'amount' as float
+        f"{WIDE + 3},1,",
+        f"{WIDE + 3},1,",
+        f"{WIDE + 2},1,-0.0",
+        f"{WIDE + 2},1,0",
+    ]
+)
+
+
+@pytest.mark.parametrize("method", ["keep_first", "keep_last", "drop_all", "flag"])
+def test_matches_handle_duplicates(tmp_path, method):
+    source = tmp_path / "rows.csv"
+    source.write_text(CSV + "\n")
+    expected = DataProcessor(filepath=source).load().handle_duplicates(method).df
+
+    output = tmp_path / "out.csv"
+    DataProcessor(filepath=source, chunksize=4).load().dedupe_external(output, method=method)
+
+    result = pd.read_csv(output, index_col=0)
+    assert result["ID"].tolist() == expected["ID"].tolist()
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+
+def test_signed_zero_and_nan_are_duplicates():
+    df = pd.DataFrame({"x": [0.0, -0.0, float("nan"), -float("nan")], "s": ["a", "a", "b", "b"]})
+    processor = DataProcessor(dataset=df).handle_duplicates("flag")
+    assert processor.df["is_duplicate"].tolist() == df.duplicated().tolist() == [False, True, False, True]
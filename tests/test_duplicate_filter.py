@@ -0,0 +1,14 @@
+import pandas as pd
+
+from processor import DataProcessor, DuplicateFilter
+
+WIDE = 1234567890123456789  # IDs this wide are not exact as float64
+
+
+def test_filter_keeps_new_wide_ids():
+    seen = DuplicateFilter(capacity=1000)
+    seen.add(DataProcessor(dataset=pd.DataFrame({"ID": [WIDE], "v": [1]})))
+
+    batch = DataProcessor(dataset=pd.DataFrame({"ID": [WIDE, WIDE + 1, WIDE + 2], "v": [1, 1, 1]}))
+    seen.drop_seen(batch)
+    assert batch.df["ID"].tolist() == [WIDE + 1, WIDE + 2]
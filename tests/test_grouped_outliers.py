@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from processor import DataProcessor
+
+
+def _frame():
+    rng = np.random.default_rng(0)
+    values = np.r_[rng.normal(100, 5, 40), 400.0]
+    return pd.DataFrame(
+        {
+            "STORE": ["a"] * 4 + ["b"] + ["c"] * 41,
+            "TOTAL_SALES": np.r_[[10.0] * 4, 55.0, values],
+        }
+    )
+
+
+def test_constant_and_single_row_groups_are_kept():
+    processor = DataProcessor(dataset=_frame()).remove_outliers_zscore(z_thresh=3, group_by="STORE")
+    counts = processor.df["STORE"].value_counts()
+
+    assert counts["a"] == 4
+    assert counts["b"] == 1
+    assert counts["c"] == 40  # only the 400.0 outlier goes
+
+
+def test_constant_groups_have_no_outliers():
+    counts = DataProcessor(dataset=_frame()).check_outliers(z_thresh=3, group_by="STORE")
+    assert counts["TOTAL_SALES"] == 1
+
+
+def test_constant_column_is_kept():
+    df = pd.DataFrame({"TOTAL_SALES": [5.0] * 10})
+    processor = DataProcessor(dataset=df).remove_outliers_zscore()
+    assert len(processor.df) == 10
@@ -0,0 +1,35 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+HEAVY_MODULES = ("matplotlib", "seaborn", "scipy", "sklearn")
+
+# pandas/numpy are imported first, so the measured time is what processor itself adds
+SCRIPT = f"""
+import json, sys
+from time import perf_counter
+import numpy, pandas
+start = perf_counter()
+import processor
+elapsed = perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))
+"""
+
+
+def _import_processor():
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT], cwd=SRC, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_import_does_not_load_heavy_modules():
+    assert _import_processor()["loaded"] == []
+
+
+def test_import_time_budget():
+    # Best of three runs, to keep a cold disk cache from failing the budget
+    seconds = min(_import_processor()["seconds"] for _ in range(3))
+    assert seconds < 0.5, f"import processor took {seconds:.2f}s on top of pandas"
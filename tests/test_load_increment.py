@@ -0,0 +1,86 @@
+import json
+
+import pandas as pd
+
+from processor import DataProcessor, DuplicateFilter
+
+
+def _rows(start, stop):
+    return pd.DataFrame(
+        {
+            "ID": range(start, stop),
+            "MANAGER": [f"m{i % 7}" for i in range(start, stop)],
+            "TOTAL_SALES": [float(i) for i in range(start, stop)],
+        }
+    )
+
+
+def _append(path, rows):
+    rows.to_csv(path, mode="a", header=not path.exists(), index=False)
+
+
+def _run(source, state, **kwargs):
+    # A new processor per run, as after a restart
+    processor = DataProcessor(filepath=source)
+    return processor.load_increment(state_path=state, subset=["MANAGER", "TOTAL_SALES"], **kwargs)
+
+
+def test_rows_survive_a_restart(tmp_path):
+    source, state = tmp_path / "pos.csv", tmp_path / "state.json"
+    _append(source, _rows(0, 50))
+    _run(source, state)
+    _append(source, _rows(50, 100))
+    _run(source, state)
+    _append(source, _rows(100, 150))
+    processor = _run(source, state)
+
+    assert processor.df["ID"].tolist() == list(range(150))
+
+
+def test_duplicates_of_earlier_runs_are_dropped_after_a_restart(tmp_path):
+    source, state = tmp_path / "pos.csv", tmp_path / "state.json"
+    _append(source, _rows(0, 50))
+    _run(source, state)
+    repeat = _rows(3, 4).assign(ID=50)  # same sale as ID 3 under a new ID
+    _append(source, pd.concat([repeat, _rows(51, 60)]))
+    processor = _run(source, state)
+
+    assert len(processor.df) == 59
+    assert 50 not in processor.df["ID"].tolist()
+
+
+def test_empty_filter_is_refilled_after_a_restart(tmp_path):
+    source, state = tmp_path / "pos.csv", tmp_path / "state.json"
+    filter_kwargs = {"capacity": 1_000, "subset": ["MANAGER", "TOTAL_SALES"]}
+    _append(source, _rows(0, 50))
+    _run(source, state, duplicate_filter=DuplicateFilter(**filter_kwargs))
+    _append(source, _rows(3, 4).assign(ID=50))
+    processor = _run(source, state, duplicate_filter=DuplicateFilter(**filter_kwargs))
+
+    assert len(processor.df) == 50
+
+
+def test_appended_rows_with_lower_ids_are_kept(tmp_path, capsys):
+    source, state = tmp_path / "pos.csv", tmp_path / "state.json"
+    _append(source, _rows(10, 20))
+    _run(source, state)
+    _append(source, _rows(0, 5))  # another till, lower IDs
+    processor = _run(source, state)
+
+    assert processor.df["ID"].tolist() == list(range(10, 20)) + list(range(5))
+    assert "5 new row(s) parsed, 0 already processed row(s) skipped" in capsys.readouterr().out
+
+
+def test_string_ids_and_re_exported_file(tmp_path, capsys):
+    source, state = tmp_path / "pos.csv", tmp_path / "state.json"
+    rows = _rows(0, 20).assign(ID=[f"R{i:03d}" for i in range(20)])
+    _append(source, rows[:10])
+    _run(source, state)
+    assert json.loads(state.read_text())["last_id"] == "R009"
+
+    source.unlink()
+    _append(source, rows[7:12])  # re-exported (smaller): three rows seen before, two new ones
+    processor = _run(source, state)
+
+    assert processor.df["ID"].tolist() == rows["ID"][:12].tolist()
+    assert "5 new row(s) parsed, 3 already processed row(s) skipped" in capsys.readouterr().out
@@ -0,0 +1,58 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from processor import DataProcessor
+
+DATA = Path(__file__).resolve().parents[1] / "data" / "foo_sales_dataset.csv"
+AMOUNTS = ["ESALES", "CARDS", "CASH", "TOTAL_SALES"]
+
+
+def _with_rekeyed_copies(seed, rows=100):
+    # Copies of sampled receipts under new keys, every amount off by up to 0.9 cents
+    rng = np.random.default_rng(seed)
+    df = pd.read_csv(DATA)
+    copies = df.sample(rows, random_state=seed)
+    copies = copies.assign(ID=copies["ID"] + 10_000, RECEIPT=copies["RECEIPT"] + 1)
+    copies[AMOUNTS] += rng.uniform(-0.009, 0.009, (rows, len(AMOUNTS)))
+    expected = {frozenset([i, i + 10_000]) for i in copies["ID"] - 10_000}
+    return pd.concat([df, copies], ignore_index=True), expected
+
+
+def _clusters(result):
+    return set(map(frozenset, result.groupby("near_duplicate_cluster")["ID"].apply(list)))
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_jittered_copies_are_found(seed):
+    df, expected = _with_rekeyed_copies(seed)
+    result = DataProcessor(dataset=df).inspect_near_duplicates(
+        numeric_cols=AMOUNTS, string_cols=["MANAGER"], exact_cols=["DATE"], tolerance=0.01
+    )
+    assert _clusters(result) == expected
+
+
+def test_defaults_skip_key_columns():
+    df, expected = _with_rekeyed_copies(0)
+    found = _clusters(DataProcessor(dataset=df).inspect_near_duplicates())
+    assert len(expected & found) >= 98
+
+
+def test_typos_in_text_are_matched():
+    df = pd.DataFrame(
+        {
+            "MANAGER": ["Dimitris", "Dimitrus", "Alice", "Charlie"],
+            "TOTAL_SALES": [100.0, 100.004, 100.0, 100.0],
+        }
+    )
+    result = DataProcessor(dataset=df).inspect_near_duplicates(string_cols=["MANAGER"])
+    assert result.index.tolist() == [0, 1]
+
+
+def test_large_buckets_are_capped():
+    df = pd.DataFrame({"TOTAL_SALES": np.zeros(5_000), "MANAGER": ["Bob"] * 5_000})
+    result = DataProcessor(dataset=df).inspect_near_duplicates(window=5)
+    assert len(result) == 5_000
+    assert result["near_duplicate_cluster"].nunique() == 1
@@ -0,0 +1,51 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import processor as module
+from processor import DataProcessor
+
+DATA = Path(__file__).resolve().parents[1] / "data" / "foo_sales_dataset.csv"
+STEPS = [
+    "check_outliers",
+    ("remove_outliers_zscore", {"z_thresh": 3}),
+    ("remove_outliers_iqr", {"column": "TOTAL_SALES"}),
+    ("remove_outliers_from_column", {"column": "CASH"}),
+]
+
+
+def _in_memory():
+    processor = DataProcessor(filepath=DATA).load()
+    counts = processor.check_outliers()
+    for name, kwargs in STEPS[1:]:
+        getattr(processor, name)(**kwargs)
+    return counts, processor.df
+
+
+@pytest.mark.parametrize("chunksize", [50, 200, 1000])
+def test_outlier_steps_do_not_depend_on_chunksize(tmp_path, chunksize):
+    counts, expected = _in_memory()
+    output = tmp_path / "out.csv"
+    processor = DataProcessor(filepath=DATA, chunksize=chunksize).load()
+    processor.process_chunks(STEPS, path=output)
+
+    assert processor.chunk_summary["check_outliers"].astype(int).equals(counts.astype(int))
+    assert pd.read_csv(output)["ID"].tolist() == expected["ID"].tolist()
+
+
+def test_grouped_outlier_steps_are_refused(tmp_path):
+    processor = DataProcessor(filepath=DATA, chunksize=100).load()
+    with pytest.raises(ValueError):
+        processor.process_chunks([("remove_outliers_zscore", {"group_by": "MANAGER"})])
+
+
+def test_iqr_quartiles_are_sampled_beyond_the_cap(monkeypatch):
+    monkeypatch.setattr(module, "_QUARTILE_SAMPLE_ROWS", 300)
+    processor = DataProcessor(filepath=DATA, chunksize=100).load()
+    stats = processor._chunk_stats([], {}, "remove_outliers_iqr", {"column": "TOTAL_SALES"})
+
+    values = pd.read_csv(DATA)["TOTAL_SALES"].dropna()
+    exact = np.quantile(values, [0.25, 0.75])
+    assert np.allclose(stats[("TOTAL_SALES", "quartiles")], exact, rtol=0.1)
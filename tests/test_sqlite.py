@@ -0,0 +1,73 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import processor as module
+from processor import DataProcessor
+
+
+def _frame(rows=25):
+    return pd.DataFrame(
+        {
+            "ID": np.arange(rows),
+            "DATE": [date(2025, 3, 1 + i % 28) for i in range(rows)],
+            "MANAGER": [None if i % 5 == 0 else f"m{i % 3}" for i in range(rows)],
+            "TOTAL_SALES": [np.nan if i % 4 == 0 else i * 1.5 for i in range(rows)],
+        }
+    )
+
+
+def test_save_converts_one_batch_at_a_time(tmp_path, monkeypatch):
+    converted = []
+    sql_values = module._sql_values
+
+    def spy(series):
+        converted.append(len(series))
+        return sql_values(series)
+
+    monkeypatch.setattr(module, "_sql_values", spy)
+    module._save_sqlite(_frame(), tmp_path / "db.sqlite", "sales", batch_size=10)
+    assert max(converted) == 10
+
+
+def test_save_round_trip_across_batches(tmp_path):
+    df = _frame()
+    module._save_sqlite(df, tmp_path / "db.sqlite", "sales", batch_size=7)
+    loaded = DataProcessor(filepath=tmp_path / "db.sqlite", table="sales").load().df
+
+    assert loaded["ID"].tolist() == df["ID"].tolist()
+    assert loaded["DATE"].tolist() == [value.isoformat() for value in df["DATE"]]
+    assert loaded["MANAGER"].isna().tolist() == df["MANAGER"].isna().tolist()
+    np.testing.assert_allclose(loaded["TOTAL_SALES"], df["TOTAL_SALES"])
+
+
+def test_upsert_keeps_existing_rows(tmp_path):
+    db = tmp_path / "db.sqlite"
+    DataProcessor(dataset=_frame(10)).save(db, format="sqlite", table="sales", upsert_on="ID")
+    update = _frame(15)[5:].assign(MANAGER="new").reset_index(drop=True)
+    DataProcessor(dataset=update).save(db, format="sqlite", table="sales", upsert_on="ID")
+    loaded = DataProcessor(filepath=db, table="sales").load().df
+
+    assert loaded["ID"].tolist() == list(range(15))
+    assert (loaded["MANAGER"][5:] == "new").all()
+
+    with pytest.raises(ValueError):
+        DataProcessor(dataset=update).save(db, format="sqlite", table="sales", upsert_on="ID", if_exists="replace")
+
+
+def test_load_reads_sqlite_in_sql_batches(tmp_path, monkeypatch):
+    db = tmp_path / "db.sqlite"
+    module._save_sqlite(_frame(), db, "sales")
+    monkeypatch.setattr(module, "_SQL_BATCH_ROWS", 10)
+    calls = []
+    iter_file_chunks = module._iter_file_chunks
+
+    def spy(path, chunksize, *args):
+        calls.append(chunksize)
+        return iter_file_chunks(path, chunksize, *args)
+
+    monkeypatch.setattr(module, "_iter_file_chunks", spy)
+    assert len(module._read_file(db, query="SELECT * FROM sales")) == 25
+    assert calls == [10]
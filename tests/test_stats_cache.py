@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+
+from processor import DataProcessor
+
+
+def _processor():
+    values = np.r_[np.zeros(19), 1.0]
+    return DataProcessor(dataset=pd.DataFrame({"x": values, "y": np.arange(20.0)}))
+
+
+def test_in_place_edits_need_invalidate_stats():
+    processor = _processor()
+    assert processor.check_missing().sum() == 0
+    assert processor.check_outliers()["x"] == 1
+
+    processor.df["x"] = np.arange(20.0)
+    processor.df.loc[0, "y"] = np.nan
+
+    processor.invalidate_stats()
+    assert processor.check_missing()["y"] == 1
+    assert processor.check_outliers()["x"] == 0
+
+
+def test_reassigning_df_invalidates_stats():
+    processor = _processor()
+    processor.check_outliers()
+    processor.df = processor.df.assign(x=np.arange(20.0))
+    assert processor.check_outliers()["x"] == 0
+    assert processor.stats_cache_info()["misses"] > 0